@@ -1,6 +1,9 @@
 # This file is used to import all the models in the models directory
 # so that they can be easily accessed from other parts of the module.
 
+# Change Logs
+from . import log_mixin
+
 # Ownership Management
 from . import ownable_mixin
 from . import ownership_log
@@ -21,3 +24,4 @@ from . import responsibility_log
 
 # Admin Dashboard
 from . import dashboard
+from . import dashboard_cache
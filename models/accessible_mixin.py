@@ -1,4 +1,4 @@
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, _
 from odoo.exceptions import ValidationError, AccessError
 
 
@@ -231,27 +231,50 @@ class AccessibleMixin(models.AbstractModel):
 
     def grant_access_to_group(self, group_id, start_date=None, end_date=None, reason=None):
         """Grant access to a specific group"""
-        if not self.can_grant_access:
+        if not all(self.mapped('can_grant_access')):
             raise AccessError(_("You don't have permission to grant access to this record."))
 
         group = self.env['res.groups'].browse(group_id)
         if not group.exists():
             raise ValidationError(_("Invalid group specified."))
 
-        if group not in self.allowed_group_ids:
-            self.allowed_group_ids = [(4, group_id)]
-
-        # Update access dates if provided
+        # Link the group and update access dates if provided in a single write;
+        # records already linked to the group are left untouched by the ORM
+        vals = {'allowed_group_ids': [(4, group.id)]}
         if start_date:
-            self.access_start_date = start_date
+            vals['access_start_date'] = start_date
         if end_date:
-            self.access_end_date = end_date
+            vals['access_end_date'] = end_date
+        self.write(vals)
 
         # Log the access grant
         self._log_access_change('grant_group', group, reason)
 
         return True
 
+    def grant_access_to_groups(self, group_ids, start_date=None, end_date=None, reason=None):
+        """Grant access to several groups at once"""
+        if not all(self.mapped('can_grant_access')):
+            raise AccessError(_("You don't have permission to grant access to this record."))
+
+        groups = self.env['res.groups'].browse(group_ids)
+        if groups - groups.exists():
+            raise ValidationError(_("Invalid group specified."))
+
+        # Link all groups and update access dates if provided in a single write
+        vals = {'allowed_group_ids': [(4, group_id) for group_id in groups.ids]}
+        if start_date:
+            vals['access_start_date'] = start_date
+        if end_date:
+            vals['access_end_date'] = end_date
+        self.write(vals)
+
+        # Log the access grant of each group
+        for group in groups:
+            self._log_access_change('grant_group', group, reason)
+
+        return True
+
     def revoke_access_from_group(self, group_id, reason=None):
         """Revoke access from a specific group"""
         if not self.can_grant_access:
@@ -271,7 +294,7 @@ class AccessibleMixin(models.AbstractModel):
 
     def grant_access_to_custom_group(self, custom_group_id, start_date=None, end_date=None, reason=None):
         """Grant access to a custom access group"""
-        if not self.can_grant_access:
+        if not all(self.mapped('can_grant_access')):
             raise AccessError(_("You don't have permission to grant access to this record."))
 
         custom_group = self.env['tk.accessible.group'].browse(custom_group_id)
@@ -281,20 +304,45 @@ class AccessibleMixin(models.AbstractModel):
         if not custom_group.active:
             raise ValidationError(_("Cannot grant access to inactive group."))
 
-        if custom_group not in self.custom_access_group_ids:
-            self.custom_access_group_ids = [(4, custom_group_id)]
-
-        # Update access dates if provided
+        # Link the group and update access dates if provided in a single write
+        vals = {'custom_access_group_ids': [(4, custom_group.id)]}
         if start_date:
-            self.access_start_date = start_date
+            vals['access_start_date'] = start_date
         if end_date:
-            self.access_end_date = end_date
+            vals['access_end_date'] = end_date
+        self.write(vals)
 
         # Log the access grant
         self._log_access_change('grant_custom_group', custom_group, reason)
 
         return True
 
+    def grant_access_to_custom_groups(self, custom_group_ids, start_date=None, end_date=None, reason=None):
+        """Grant access to several custom access groups at once"""
+        if not all(self.mapped('can_grant_access')):
+            raise AccessError(_("You don't have permission to grant access to this record."))
+
+        custom_groups = self.env['tk.accessible.group'].browse(custom_group_ids)
+        if custom_groups - custom_groups.exists():
+            raise ValidationError(_("Invalid custom group specified."))
+
+        if not all(custom_groups.mapped('active')):
+            raise ValidationError(_("Cannot grant access to inactive group."))
+
+        # Link all groups and update access dates if provided in a single write
+        vals = {'custom_access_group_ids': [(4, group_id) for group_id in custom_groups.ids]}
+        if start_date:
+            vals['access_start_date'] = start_date
+        if end_date:
+            vals['access_end_date'] = end_date
+        self.write(vals)
+
+        # Log the access grant of each group
+        for custom_group in custom_groups:
+            self._log_access_change('grant_custom_group', custom_group, reason)
+
+        return True
+
     def revoke_access_from_custom_group(self, custom_group_id, reason=None):
         """Revoke access from a custom access group"""
         if not self.can_grant_access:
@@ -335,35 +383,64 @@ class AccessibleMixin(models.AbstractModel):
         return custom_group
 
     def set_access_level(self, level, reason=None):
-        """Set the access level for this record"""
-        if not self.can_grant_access:
+        """Set the access level for these records"""
+        if not all(self.mapped('can_grant_access')):
             raise AccessError(_("You don't have permission to change access level of this record."))
 
         if level not in dict(self._fields['access_level'].selection):
             raise ValidationError(_("Invalid access level specified."))
 
-        old_level = self.access_level
-        self.access_level = level
+        # Records already at this level need neither a write nor a log entry
+        changed = self.filtered(lambda r: r.access_level != level)
+        if not changed:
+            return True
+
+        records_by_old_level = [
+            (old_level, self.concat(*records))
+            for old_level, records in tools.groupby(changed, key=lambda r: r.access_level)
+        ]
+        changed.write({'access_level': level})
 
-        # Log the access level change
-        self._log_access_change('change_level', None, reason,
-                              extra_info=f"From {old_level} to {level}")
+        # Log the access level change, one batch per previous level
+        for old_level, records in records_by_old_level:
+            records._log_access_change('change_level', None, reason,
+                                     extra_info=f"From {old_level} to {level}")
 
         return True
 
     def set_access_duration(self, start_date=None, end_date=None, reason=None):
-        """Set the access duration for this record"""
-        if not self.can_grant_access:
+        """Set the access duration for these records"""
+        if not all(self.mapped('can_grant_access')):
             raise AccessError(_("You don't have permission to change access duration of this record."))
 
+        vals = {}
         if start_date:
-            self.access_start_date = start_date
+            vals['access_start_date'] = start_date
         if end_date:
-            self.access_end_date = end_date
+            vals['access_end_date'] = end_date
+        if not vals:
+            # Nothing to write, but the request itself is still logged for every record
+            self._log_access_change('change_duration', None, reason,
+                                  extra_info=f"Start: {start_date}, End: {end_date}")
+            return True
+
+        # Records already holding these dates need neither a write nor a log entry;
+        # compare in the cache format so that dates given as strings match too
+        cache_vals = {
+            fname: self._fields[fname].convert_to_cache(value, self)
+            for fname, value in vals.items()
+        }
+        changed = self.filtered(
+            lambda r: any(r[fname] != value for fname, value in cache_vals.items())
+        )
+        if not changed:
+            return True
+
+        changed.write(vals)
 
         # Log the access duration change
-        self._log_access_change('change_duration', None, reason,
-                              extra_info=f"Start: {start_date}, End: {end_date}")
+        changed._log_access_change('change_duration', None, reason,
+                                 extra_info=f"Start: {start_date}, End: {end_date}")
 
         return True
 
@@ -381,29 +458,36 @@ class AccessibleMixin(models.AbstractModel):
 
     def bulk_grant_access_to_users(self, user_ids, start_date=None, end_date=None, reason=None):
         """Grant access to multiple users at once"""
-        if not self.can_grant_access:
+        if not all(self.mapped('can_grant_access')):
             raise AccessError(_("You don't have permission to grant access to this record."))
 
         if not user_ids:
             raise ValidationError(_("At least one user must be specified."))
 
         users = self.env['res.users'].browse(user_ids)
-        if not all(user.exists() for user in users):
+        if users - users.exists():
             raise ValidationError(_("One or more invalid users specified."))
 
-        # Add users that aren't already in allowed_user_ids
-        new_users = users.filtered(lambda u: u not in self.allowed_user_ids)
-        if new_users:
-            self.allowed_user_ids = [(4, user_id) for user_id in new_users.ids]
-            user_names = ', '.join(new_users.mapped('name'))
-            self._log_access_change('bulk_grant_users', None, reason,
-                                  extra_info=f"Granted access to: {user_names}")
+        # Records missing the same users are logged together
+        records_by_new_users = [
+            (new_users, self.concat(*records))
+            for new_users, records in tools.groupby(self, key=lambda r: users - r.allowed_user_ids)
+            if new_users
+        ]
 
+        # Link the users and update access dates if provided in a single write;
+        # users already allowed on a record are left untouched by the ORM
+        vals = {'allowed_user_ids': [(4, user_id) for user_id in users.ids]}
         if start_date:
-            self.access_start_date = start_date
-
+            vals['access_start_date'] = start_date
         if end_date:
-            self.access_end_date = end_date
+            vals['access_end_date'] = end_date
+        self.write(vals)
+
+        for new_users, records in records_by_new_users:
+            user_names = ', '.join(new_users.mapped('name'))
+            records._log_access_change('bulk_grant_users', None, reason,
+                                     extra_info=f"Granted access to: {user_names}")
 
         return True
 
@@ -441,14 +525,16 @@ class AccessibleMixin(models.AbstractModel):
                 elif target._name == 'tk.accessible.group':
                     target_custom_group_id = target.id
 
-        self.env['tk.access.log'].create({
+        # One entry per record, created in a single batch
+        now = fields.Datetime.now()
+        self.env['tk.access.log'].create([{
             'model_name': self._name,
-            'res_id': self.id,
+            'res_id': record.id,
             'action': action,
             'target_user_id': target_user_id,
             'target_group_id': target_group_id,
             'reason': reason or '',
             'extra_info': extra_info or '',
-            'user_id': self.env.user.id,
-            'date': fields.Datetime.now()
-        })
+            'user_id': self.env.uid,
+            'date': now
+        } for record in self])
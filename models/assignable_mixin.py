@@ -1,6 +1,8 @@
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, _
 from odoo.exceptions import ValidationError, AccessError
 
+from .utils import is_current_user_admin
+
 
 class AssignableMixin(models.AbstractModel):
     _name = 'tk.assignable.mixin'
@@ -101,13 +103,10 @@ class AssignableMixin(models.AbstractModel):
             record.is_assigned_to_me = self.env.user in record.assigned_user_ids
 
     def _compute_can_assign(self):
+        is_admin = is_current_user_admin(self.env)
+        # Basic permission check
+        has_basic_permission = self.env.user.has_group('base.group_user') or is_admin
         for record in self:
-            # Basic permission check
-            has_basic_permission = (
-                self.env.user.has_group('base.group_user') or
-                self.env.user.has_group('base.group_system')
-            )
-
             # Check if user is currently assigned
             is_assigned = self.env.user in record.assigned_user_ids
 
@@ -149,13 +148,13 @@ class AssignableMixin(models.AbstractModel):
             # User can assign if they have basic permission AND (is assigned OR ownership OR access)
             record.can_assign = (
                 has_basic_permission and
-                (is_assigned or has_ownership or has_access or self.env.user.has_group('base.group_system'))
+                (is_assigned or has_ownership or has_access or is_admin)
             )
 
     def assign_to_users(self, user_ids, deadline=None, description=None,
                        priority='normal', reason=None):
-        """Assign record to multiple users"""
-        if not self.can_assign and not self.env.user.has_group('base.group_system'):
+        """Assign records to multiple users"""
+        if not all(self.mapped('can_assign')) and not is_current_user_admin(self.env):
             raise AccessError(_("You don't have permission to assign this record."))
 
         if not user_ids:
@@ -166,10 +165,14 @@ class AssignableMixin(models.AbstractModel):
             user_ids = [user_ids] if user_ids else []
 
         users = self.env['res.users'].browse(user_ids)
-        if not all(user.exists() for user in users):
+        if users - users.exists():
             raise ValidationError(_("One or more invalid users specified for assignment."))
 
-        old_assigned = self.assigned_user_ids
+        # Records previously assigned to the same users are logged together
+        records_by_old_assigned = [
+            (old_assigned, self.concat(*records))
+            for old_assigned, records in tools.groupby(self, key=lambda r: r.assigned_user_ids)
+        ]
 
         # Assign to users
         vals = {
@@ -187,7 +190,8 @@ class AssignableMixin(models.AbstractModel):
         self.write(vals)
 
         # Log the assignment
-        self._log_assignment_change('assign_multiple', old_assigned, users, reason)
+        for old_assigned, records in records_by_old_assigned:
+            records._log_assignment_change('assign_multiple', old_assigned, users, reason)
 
         return True
 
@@ -283,7 +287,7 @@ class AssignableMixin(models.AbstractModel):
 
     def start_assignment(self, reason=None):
         """Mark assignment as in progress"""
-        if self.env.user not in self.assigned_user_ids and not self.env.user.has_group('base.group_system'):
+        if self.env.user not in self.assigned_user_ids and not is_current_user_admin(self.env):
             raise AccessError(_("You are not assigned to this record."))
 
         self.assignment_status = 'in_progress'
@@ -295,7 +299,7 @@ class AssignableMixin(models.AbstractModel):
 
     def complete_assignment(self, reason=None):
         """Mark assignment as completed"""
-        if self.env.user not in self.assigned_user_ids and not self.env.user.has_group('base.group_system'):
+        if self.env.user not in self.assigned_user_ids and not is_current_user_admin(self.env):
             raise AccessError(_("You are not assigned to this record."))
 
         self.assignment_status = 'completed'
@@ -324,40 +328,28 @@ class AssignableMixin(models.AbstractModel):
 
     def _log_assignment_change(self, action, old_users, new_users, reason):
         """Log assignment changes"""
-        old_user_names = []
-        new_user_names = []
+        # The users are shared by every record, read their names once
+        old_user_names = old_users.mapped('name') if old_users else []
+        new_user_names = new_users.mapped('name') if new_users else []
 
-        if old_users:
-            if hasattr(old_users, '__iter__'):
-                old_user_names = [user.name for user in old_users]
-            else:
-                old_user_names = [old_users.name]
+        extra_info = " | ".join(filter(None, [
+            old_user_names and f"Previous: {', '.join(old_user_names)}",
+            new_user_names and f"New: {', '.join(new_user_names)}",
+        ]))
 
-        if new_users:
-            if hasattr(new_users, '__iter__'):
-                new_user_names = [user.name for user in new_users]
-            else:
-                new_user_names = [new_users.name]
-
-        extra_info = ""
-        if old_user_names:
-            extra_info += f"Previous: {', '.join(old_user_names)}"
-        if new_user_names:
-            if extra_info:
-                extra_info += " | "
-            extra_info += f"New: {', '.join(new_user_names)}"
-
-        self.env['tk.assignment.log'].create({
+        # One entry per record, created in a single batch
+        now = fields.Datetime.now()
+        self.env['tk.assignment.log'].create([{
             'model_name': self._name,
-            'res_id': self.id,
+            'res_id': record.id,
             'action': action,
             'old_assigned_user_id': old_users[0].id if old_users and len(old_users) > 0 else False,
             'new_assigned_user_id': new_users[0].id if new_users and len(new_users) > 0 else False,
             'reason': reason or '',
             'extra_info': extra_info,
-            'user_id': self.env.user.id,
-            'date': fields.Datetime.now()
-        })
+            'user_id': self.env.uid,
+            'date': now
+        } for record in self])
 
     def _search_is_assigned_to_me(self, operator, value):
         """Search method for is_assigned_to_me field"""
@@ -375,7 +367,7 @@ class AssignableMixin(models.AbstractModel):
         if operator == '=' and value:
             # Records where user has some level of access
             domain = []
-            if self.env.user.has_group('base.group_system'):
+            if is_current_user_admin(self.env):
                 domain = [('id', '!=', False)]  # System admin can assign any record
             else:
                 # Basic users can assign records they're assigned to or own
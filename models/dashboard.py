@@ -1,6 +1,15 @@
-from odoo import models, fields, api, _
+import logging
+
+from odoo import models, fields, api, tools, _
+from odoo.fields import Command
+from odoo.exceptions import AccessError
 from datetime import datetime, timedelta
 
+# Badge counters stop counting past this value and are displayed as "1000+"
+STATUS_COUNT_CAP = 1000
+
+_logger = logging.getLogger(__name__)
+
 
 class ComprehensiveDashboard(models.TransientModel):
     _name = 'tk.comprehensive.dashboard'
@@ -22,423 +31,506 @@ class ComprehensiveDashboard(models.TransientModel):
     # Summary Statistics
     total_ownership_changes = fields.Integer(
         string='Total Ownership Changes',
-        compute='_compute_statistics'
+        compute='_compute_all'
     )
     total_assignment_changes = fields.Integer(
         string='Total Assignment Changes',
-        compute='_compute_statistics'
+        compute='_compute_all'
     )
     total_access_changes = fields.Integer(
         string='Total Access Changes',
-        compute='_compute_statistics'
+        compute='_compute_all'
     )
     total_responsibility_changes = fields.Integer(
         string='Total Responsibility Changes',
-        compute='_compute_statistics'
+        compute='_compute_all'
     )
 
     # Current Status Counts
     unowned_records_count = fields.Integer(
         string='Unowned Records',
-        compute='_compute_current_status'
+        compute='_compute_all'
     )
     unassigned_records_count = fields.Integer(
         string='Unassigned Records',
-        compute='_compute_current_status'
+        compute='_compute_all'
     )
     overdue_assignments_count = fields.Integer(
         string='Overdue Assignments',
-        compute='_compute_current_status'
+        compute='_compute_all'
     )
     expired_responsibilities_count = fields.Integer(
         string='Expired Responsibilities',
-        compute='_compute_current_status'
+        compute='_compute_all'
     )
     restricted_access_count = fields.Integer(
         string='Restricted Access Records',
-        compute='_compute_current_status'
+        compute='_compute_all'
     )
 
     # User-specific counts
     my_owned_records_count = fields.Integer(
         string='My Owned Records',
-        compute='_compute_user_statistics'
+        compute='_compute_all'
     )
     my_assignments_count = fields.Integer(
         string='My Assignments',
-        compute='_compute_user_statistics'
+        compute='_compute_all'
     )
     my_responsibilities_count = fields.Integer(
         string='My Responsibilities',
-        compute='_compute_user_statistics'
+        compute='_compute_all'
     )
     my_overdue_assignments_count = fields.Integer(
         string='My Overdue Assignments',
-        compute='_compute_user_statistics'
+        compute='_compute_all'
     )
     my_co_owned_records_count = fields.Integer(
         string='My Co-owned Records',
-        compute='_compute_user_statistics'
+        compute='_compute_all'
     )
     my_secondary_responsibilities_count = fields.Integer(
         string='My Secondary Responsibilities',
-        compute='_compute_user_statistics'
+        compute='_compute_all'
     )
 
     # Recent Activity Statistics
     recent_ownership_transfers = fields.Integer(
         string='Recent Ownership Transfers',
-        compute='_compute_recent_activity'
+        compute='_compute_all'
     )
     recent_new_assignments = fields.Integer(
         string='Recent New Assignments',
-        compute='_compute_recent_activity'
+        compute='_compute_all'
     )
     recent_access_grants = fields.Integer(
         string='Recent Access Grants',
-        compute='_compute_recent_activity'
+        compute='_compute_all'
     )
     recent_responsibility_changes = fields.Integer(
         string='Recent Responsibility Changes',
-        compute='_compute_recent_activity'
+        compute='_compute_all'
     )
 
     # Additional fields for the view
     top_ownership_transferrer = fields.Char(
         string='Top Ownership Transferrer',
-        compute='_compute_top_users'
+        compute='_compute_all'
     )
     top_assigner = fields.Char(
         string='Top Assigner',
-        compute='_compute_top_users'
+        compute='_compute_all'
     )
     most_responsible_user = fields.Char(
         string='Most Responsible User',
-        compute='_compute_top_users'
+        compute='_compute_all'
     )
 
     # Recent logs fields
     recent_ownership_logs = fields.Many2many(
         'tk.ownership.log',
-        compute='_compute_recent_logs',
+        compute='_compute_all',
         string='Recent Ownership Logs'
     )
     recent_assignment_logs = fields.Many2many(
         'tk.assignment.log',
-        compute='_compute_recent_logs',
+        compute='_compute_all',
         string='Recent Assignment Logs'
     )
     recent_access_logs = fields.Many2many(
         'tk.access.log',
-        compute='_compute_recent_logs',
+        compute='_compute_all',
         string='Recent Access Logs'
     )
     recent_responsibility_logs = fields.Many2many(
         'tk.responsibility.log',
-        compute='_compute_recent_logs',
+        compute='_compute_all',
         string='Recent Responsibility Logs'
     )
 
-    def _compute_statistics(self):
-        """Compute general statistics"""
+    @api.depends('date_from', 'date_to')
+    @api.depends_context('uid')
+    def _compute_all(self):
+        """Compute all dashboard statistics in a single pass"""
+        cache = self.env['tk.dashboard.cache'].sudo()
+        stat_fields = self._get_stat_fields()
+        # Take a single snapshot of the current time for every section and dashboard
+        today = fields.Date.today()
+        now = fields.Datetime.now()
+
+        # Use the cached statistics when they are still fresh
+        dashboards = self.browse()
+        cache_keys = {}
         for dashboard in self:
-            # Get date range
-            date_from = dashboard.date_from or fields.Date.today() - timedelta(days=30)
-            date_to = dashboard.date_to or fields.Date.today()
-
-            # Convert dates to datetime for comparison
-            datetime_from = fields.Datetime.to_datetime(date_from)
-            datetime_to = fields.Datetime.to_datetime(date_to) + timedelta(days=1)
-
-            # Count ownership changes
-            dashboard.total_ownership_changes = self.env['tk.ownership.log'].search_count([
-                ('create_date', '>=', datetime_from),
-                ('create_date', '<', datetime_to)
-            ])
-
-            # Count assignment changes
-            dashboard.total_assignment_changes = self.env['tk.assignment.log'].search_count([
-                ('create_date', '>=', datetime_from),
-                ('create_date', '<', datetime_to)
-            ])
-
-            # Count access changes
-            dashboard.total_access_changes = self.env['tk.access.log'].search_count([
-                ('create_date', '>=', datetime_from),
-                ('create_date', '<', datetime_to)
-            ])
-
-            # Count responsibility changes
-            dashboard.total_responsibility_changes = self.env['tk.responsibility.log'].search_count([
-                ('create_date', '>=', datetime_from),
-                ('create_date', '<', datetime_to)
-            ])
-
-    def _compute_current_status(self):
+            cache_keys[dashboard.id] = dashboard._get_cache_key(today)
+            payload = cache._get_payload(*cache_keys[dashboard.id])
+            if all(name in payload for name in stat_fields):
+                dashboard.update(dashboard._convert_from_cache(payload))
+            else:
+                dashboards |= dashboard
+        if not dashboards:
+            return
+
+        recent_date = now - timedelta(days=7)
+
+        # Statistics that do not depend on the date range are shared by all dashboards
+        counted_models = self._get_counted_models()
+        shared_values = {
+            **self._get_current_status(now, counted_models),
+            **self._get_user_statistics(now, counted_models),
+        }
+
+        for dashboard in dashboards:
+            user_id, date_from, date_to = cache_keys[dashboard.id]
+            datetime_from, datetime_to = dashboard._get_datetime_range(today)
+
+            values = {
+                **shared_values,
+                **self._get_log_statistics(datetime_from, datetime_to, recent_date),
+            }
+            dashboard.update(dashboard._convert_from_cache(values, check_exists=False))
+            cache._set_payload(user_id, date_from, date_to, values)
+
+    def _get_current_status(self, now, counted_models):
         """Compute current status counts from actual models using mixins"""
-        for record in self:
-            # Initialize counts
-            unowned_count = 0
-            unassigned_count = 0
-            overdue_count = 0
-            expired_responsibilities_count = 0
-            restricted_access_count = 0
-
-            # Count from ownable models
-            for model_name in record.get_ownable_models():
-                try:
-                    model = self.env[model_name]
-                    unowned_count += model.search_count([('is_owned', '=', False)])
-                except:
-                    continue
-
-            # Count from assignable models
-            for model_name in record.get_assignable_models():
-                try:
-                    model = self.env[model_name]
-                    unassigned_count += model.search_count([('is_assigned', '=', False)])
-                    overdue_count += model.search_count([('is_overdue', '=', True)])
-                except:
-                    continue
-
-            # Count from responsible models
-            for model_name in record.get_responsible_models():
-                try:
-                    model = self.env[model_name]
-                    expired_responsibilities_count += model.search_count([('is_responsibility_expired', '=', True)])
-                except:
-                    continue
-
-            # Count from accessible models
-            for model_name in record.get_accessible_models():
-                try:
-                    model = self.env[model_name]
-                    restricted_access_count += model.search_count([('access_level', '=', 'restricted')])
-                except:
-                    continue
-
-            record.unowned_records_count = unowned_count
-            record.unassigned_records_count = unassigned_count
-            record.overdue_assignments_count = overdue_count
-            record.expired_responsibilities_count = expired_responsibilities_count
-            record.restricted_access_count = restricted_access_count
-
-    def _compute_user_statistics(self):
+        assignable_models = counted_models['assignable']
+
+        # One UNION ALL query per condition over all the mixin tables
+        return {
+            'unowned_records_count': self._count_across_models(
+                counted_models['ownable'], [('is_owned', '=', False)], cap=STATUS_COUNT_CAP),
+            'unassigned_records_count': self._count_across_models(
+                assignable_models, [('is_assigned', '=', False)]),
+            # is_overdue and is_responsibility_expired are not stored, use their definitions instead
+            'overdue_assignments_count': self._count_across_models(assignable_models, [
+                ('assignment_deadline', '<', now),
+                ('assignment_status', 'in', ['assigned', 'in_progress'])
+            ]),
+            'expired_responsibilities_count': self._count_across_models(
+                counted_models['responsible'], [('responsibility_end_date', '<', now)]),
+            'restricted_access_count': self._count_across_models(
+                counted_models['accessible'], [('access_level', '=', 'restricted')], cap=STATUS_COUNT_CAP),
+        }
+
+    def _get_user_statistics(self, now, counted_models):
         """Compute user-specific statistics from actual models using mixins"""
-        for record in self:
-            current_user = self.env.user
-
-            # Initialize counts
-            my_owned_count = 0
-            my_assignments_count = 0
-            my_responsibilities_count = 0
-            my_overdue_assignments_count = 0
-            my_co_owned_count = 0
-            my_secondary_responsibilities_count = 0
-
-            # Count from ownable models
-            for model_name in record.get_ownable_models():
-                try:
-                    model = self.env[model_name]
-                    my_owned_count += model.search_count([('owner_id', '=', current_user.id)])
-                    my_co_owned_count += model.search_count([('co_owner_ids', 'in', [current_user.id])])
-                except:
-                    continue
-
-            # Count from assignable models
-            for model_name in record.get_assignable_models():
-                try:
-                    model = self.env[model_name]
-                    my_assignments_count += model.search_count([('assigned_user_ids', 'in', [current_user.id])])
-                    my_overdue_assignments_count += model.search_count([
-                        ('assigned_user_ids', 'in', [current_user.id]),
-                        ('is_overdue', '=', True)
-                    ])
-                except:
-                    continue
-
-            # Count from responsible models
-            for model_name in record.get_responsible_models():
-                try:
-                    model = self.env[model_name]
-                    my_responsibilities_count += model.search_count([('responsible_user_ids', 'in', [current_user.id])])
-                    my_secondary_responsibilities_count += model.search_count(
-                        [('secondary_responsible_ids', 'in', [current_user.id])])
-                except:
-                    continue
-
-            record.my_owned_records_count = my_owned_count
-            record.my_assignments_count = my_assignments_count
-            record.my_responsibilities_count = my_responsibilities_count
-            record.my_overdue_assignments_count = my_overdue_assignments_count
-            record.my_co_owned_records_count = my_co_owned_count
-            record.my_secondary_responsibilities_count = my_secondary_responsibilities_count
+        uid = self.env.uid
+        ownable_models = counted_models['ownable']
+        responsible_models = counted_models['responsible']
+
+        # Split assignments on the overdue condition in the same query
+        assignment_counts = self._count_user_links(
+            counted_models['assignable'], 'assigned_user_ids', uid,
+            group_expr='COALESCE("{table}".assignment_deadline < %s'
+                       ' AND "{table}".assignment_status IN (\'assigned\', \'in_progress\'), FALSE)',
+            group_params=[now]
+        )
+
+        return {
+            'my_owned_records_count': self._count_across_models(ownable_models, [('owner_id', '=', uid)]),
+            'my_co_owned_records_count': sum(self._count_user_links(ownable_models, 'co_owner_ids', uid).values()),
+            'my_assignments_count': sum(assignment_counts.values()),
+            'my_overdue_assignments_count': assignment_counts.get(True, 0),
+            'my_responsibilities_count': sum(
+                self._count_user_links(responsible_models, 'responsible_user_ids', uid).values()),
+            'my_secondary_responsibilities_count': sum(
+                self._count_user_links(responsible_models, 'secondary_responsible_ids', uid).values()),
+        }
+
+    def _get_counted_models(self):
+        """Return, for each toolkit mixin, the models inheriting it that have a table,
+        may contain rows and are readable by the current user"""
+        classified = self._classify_mixin_models()
+        readable_models = {}
+        for model_name in set().union(*classified.values()):
+            model = self.env[model_name]
+            if model._abstract:
+                continue
+            if not model.check_access_rights('read', raise_exception=False):
+                _logger.debug("Skipping %s in dashboard counts: no read access", model_name)
+                continue
+            readable_models[model._table] = model
+
+        # The planner statistics only hint at empty tables: an estimate of zero can be stale
+        # until the next analyze, so confirm that the hinted tables really have no row.
+        # Tables never analyzed have a negative estimate since PostgreSQL 14 and are kept.
+        empty_tables = set()
+        if readable_models:
+            self.env.cr.execute("""
+                SELECT relname FROM pg_class
+                 WHERE relname IN %s AND relnamespace = current_schema()::regnamespace
+                   AND relkind = 'r' AND reltuples = 0
+            """, [tuple(readable_models)])
+            hinted_tables = [relname for relname, in self.env.cr.fetchall()]
+            if hinted_tables:
+                for table in hinted_tables:
+                    readable_models[table].flush_model()
+                self.env.cr.execute(" UNION ALL ".join(
+                    f'SELECT %s WHERE NOT EXISTS (SELECT 1 FROM "{table}")' for table in hinted_tables
+                ), hinted_tables)
+                empty_tables = {table for table, in self.env.cr.fetchall()}
+
+        return {
+            key: [
+                self.env[model_name] for model_name in model_names
+                if self.env[model_name]._table in readable_models
+                and self.env[model_name]._table not in empty_tables
+            ]
+            for key, model_names in classified.items()
+        }
+
+    def _get_query_parts(self, model, domain):
+        """Return the FROM clause, WHERE clause and params for ``domain`` on ``model``,
+        including the record rules of the current user"""
+        model.flush_model()
+        query = model._where_calc(domain)
+        model._apply_ir_rules(query, 'read')
+        return query.get_sql()
+
+    def _count_across_models(self, models, domain, cap=None):
+        """Count the records matching ``domain`` over all ``models`` in a single UNION ALL query.
+
+        With ``cap``, each table stops scanning after ``cap`` matching rows and the
+        total is capped as well, for counters where only "more than ``cap``" matters.
+        """
+        selects, params = [], []
+        for model in models:
+            from_clause, where_clause, where_params = self._get_query_parts(model, domain)
+            select = f"SELECT 1 FROM {from_clause}"
+            if where_clause:
+                select += f" WHERE {where_clause}"
+            if cap:
+                select += f" LIMIT {int(cap)}"
+            selects.append(f"SELECT COUNT(*) FROM ({select}) AS sub")
+            params += where_params
+        if not selects:
+            return 0
+        self.env.cr.execute(" UNION ALL ".join(selects), params)
+        count = sum(count for count, in self.env.cr.fetchall())
+        return min(count, cap) if cap else count
+
+    def _count_user_links(self, models, field_name, user_id, group_expr='TRUE', group_params=()):
+        """Count records linked to ``user_id`` through the many2many ``field_name`` over all ``models``.
+
+        The relation tables are joined directly and the counts are grouped on the SQL
+        expression ``group_expr`` (``{table}`` is replaced by each model table), so related
+        counters for every model come back in one UNION ALL query.
+        Returns a dict mapping each value of ``group_expr`` to its count.
+        """
+        selects, params = [], []
+        for model in models:
+            field = model._fields[field_name]
+            from_clause, where_clause, where_params = self._get_query_parts(model, [])
+            select = f"""
+                SELECT {group_expr.format(table=model._table)} AS grp, COUNT(*) AS cnt
+                  FROM {from_clause}
+                  JOIN "{field.relation}" AS rel ON rel."{field.column1}" = "{model._table}".id
+                 WHERE {where_clause or "TRUE"}
+                   AND rel."{field.column2}" = %s
+            """
+            selects.append(select + " GROUP BY 1")
+            # The params of the FROM and WHERE clauses come in order, the user filter follows them
+            params += [*group_params, *where_params, user_id]
+        counts = {}
+        if not selects:
+            return counts
+        self.env.cr.execute(" UNION ALL ".join(selects), params)
+        for group, count in self.env.cr.fetchall():
+            counts[group] = counts.get(group, 0) + count
+        return counts
+
+    @tools.ormcache()
+    def _classify_mixin_models(self):
+        """Sort the models of the registry by the toolkit mixins they inherit, in a single pass"""
+        buckets = {'ownable': [], 'assignable': [], 'responsible': [], 'accessible': []}
+        mixins = {
+            'tk.ownable.mixin': 'ownable',
+            'tk.assignable.mixin': 'assignable',
+            'tk.responsible.mixin': 'responsible',
+            'tk.accessible.mixin': 'accessible',
+        }
+        for model_name, model in self.env.registry.items():
+            parents = getattr(model, '_inherit', None) or []
+            if isinstance(parents, str):
+                parents = [parents]
+            for parent in parents:
+                if parent in mixins:
+                    buckets[mixins[parent]].append(model_name)
+        return {key: tuple(model_names) for key, model_names in buckets.items()}
 
     def get_ownable_models(self):
         """Get all models that inherit from ownable mixin"""
-        models = []
-        for model_name in self.env.registry:
-            model = self.env.registry[model_name]
-            if hasattr(model, '_inherit') and 'tk.ownable.mixin' in (model._inherit or []):
-                models.append(model_name)
-        return models
+        return list(self._classify_mixin_models()['ownable'])
 
     def get_assignable_models(self):
         """Get all models that inherit from assignable mixin"""
-        models = []
-        for model_name in self.env.registry:
-            model = self.env.registry[model_name]
-            if hasattr(model, '_inherit') and 'tk.assignable.mixin' in (model._inherit or []):
-                models.append(model_name)
-        return models
+        return list(self._classify_mixin_models()['assignable'])
 
     def get_responsible_models(self):
         """Get all models that inherit from responsible mixin"""
-        models = []
-        for model_name in self.env.registry:
-            model = self.env.registry[model_name]
-            if hasattr(model, '_inherit') and 'tk.responsible.mixin' in (model._inherit or []):
-                models.append(model_name)
-        return models
+        return list(self._classify_mixin_models()['responsible'])
 
     def get_accessible_models(self):
         """Get all models that inherit from accessible mixin"""
-        models = []
-        for model_name in self.env.registry:
-            model = self.env.registry[model_name]
-            if hasattr(model, '_inherit') and 'tk.accessible.mixin' in (model._inherit or []):
-                models.append(model_name)
-        return models
-
-    def _compute_recent_activity(self):
-        """Compute recent activity statistics"""
-        for dashboard in self:
-            # Last 7 days
-            recent_date = fields.Datetime.now() - timedelta(days=7)
-
-            dashboard.recent_ownership_transfers = self.env['tk.ownership.log'].search_count([
-                ('create_date', '>=', recent_date),
-                ('action', '=', 'transfer')
-            ])
-
-            dashboard.recent_new_assignments = self.env['tk.assignment.log'].search_count([
-                ('create_date', '>=', recent_date),
-                ('action', 'in', ['assign', 'assign_multiple'])
-            ])
-
-            dashboard.recent_access_grants = self.env['tk.access.log'].search_count([
-                ('create_date', '>=', recent_date),
-                ('action', 'like', 'grant%')
-            ])
-
-            dashboard.recent_responsibility_changes = self.env['tk.responsibility.log'].search_count([
-                ('create_date', '>=', recent_date),
-                ('action', 'in', ['assign', 'delegate', 'transfer'])
-            ])
-
-    def _compute_top_users(self):
-        """Compute top users statistics"""
-        for dashboard in self:
-            # Get date range
-            date_from = dashboard.date_from or fields.Date.today() - timedelta(days=30)
-            date_to = dashboard.date_to or fields.Date.today()
-            datetime_from = fields.Datetime.to_datetime(date_from)
-            datetime_to = fields.Datetime.to_datetime(date_to) + timedelta(days=1)
-
-            # Top ownership transferrer
-            try:
-                ownership_logs = self.env['tk.ownership.log'].read_group([
-                    ('create_date', '>=', datetime_from),
-                    ('create_date', '<', datetime_to),
-                    ('action', '=', 'transfer')
-                ], ['user_id'], ['user_id'])
-
-                if ownership_logs:
-                    top_transferrer = max(ownership_logs, key=lambda x: x['user_id_count'])
-                    user = self.env['res.users'].browse(top_transferrer['user_id'][0])
-                    dashboard.top_ownership_transferrer = f"{user.name} ({top_transferrer['user_id_count']} transfers)"
-                else:
-                    dashboard.top_ownership_transferrer = "No transfers"
-            except:
-                dashboard.top_ownership_transferrer = "No transfers"
-
-            # Top assigner
-            try:
-                assignment_logs = self.env['tk.assignment.log'].read_group([
-                    ('create_date', '>=', datetime_from),
-                    ('create_date', '<', datetime_to)
-                ], ['user_id'], ['user_id'])
-
-                if assignment_logs:
-                    top_assigner = max(assignment_logs, key=lambda x: x['user_id_count'])
-                    user = self.env['res.users'].browse(top_assigner['user_id'][0])
-                    dashboard.top_assigner = f"{user.name} ({top_assigner['user_id_count']} assignments)"
-                else:
-                    dashboard.top_assigner = "No assignments"
-            except:
-                dashboard.top_assigner = "No assignments"
-
-            # Most responsible user
-            try:
-                responsibility_logs = self.env['tk.responsibility.log'].read_group([
-                    ('create_date', '>=', datetime_from),
-                    ('create_date', '<', datetime_to)
-                ], ['new_responsible_user_id'], ['new_responsible_user_id'])
-
-                if responsibility_logs:
-                    most_responsible = max(responsibility_logs, key=lambda x: x['new_responsible_user_id_count'])
-                    user = self.env['res.users'].browse(most_responsible['new_responsible_user_id'][0])
-                    dashboard.most_responsible_user = f"{user.name} ({most_responsible['new_responsible_user_id_count']} responsibilities)"
-                else:
-                    dashboard.most_responsible_user = "No responsibilities"
-            except:
-                dashboard.most_responsible_user = "No responsibilities"
-
-    def _compute_recent_logs(self):
-        """Compute recent logs for display"""
-        for dashboard in self:
-            # Get recent logs (last 10 entries)
-            try:
-                ownership_logs = self.env['tk.ownership.log'].search([
-                    ('create_date', '>=', fields.Datetime.now() - timedelta(days=7))
-                ], limit=10, order='create_date desc')
-                dashboard.recent_ownership_logs = ownership_logs
-            except:
-                dashboard.recent_ownership_logs = self.env['tk.ownership.log']
-
-            try:
-                assignment_logs = self.env['tk.assignment.log'].search([
-                    ('create_date', '>=', fields.Datetime.now() - timedelta(days=7))
-                ], limit=10, order='create_date desc')
-                dashboard.recent_assignment_logs = assignment_logs
-            except:
-                dashboard.recent_assignment_logs = self.env['tk.assignment.log']
-
-            try:
-                access_logs = self.env['tk.access.log'].search([
-                    ('create_date', '>=', fields.Datetime.now() - timedelta(days=7))
-                ], limit=10, order='create_date desc')
-                dashboard.recent_access_logs = access_logs
-            except:
-                dashboard.recent_access_logs = self.env['tk.access.log']
-
-            try:
-                responsibility_logs = self.env['tk.responsibility.log'].search([
-                    ('create_date', '>=', fields.Datetime.now() - timedelta(days=7))
-                ], limit=10, order='create_date desc')
-                dashboard.recent_responsibility_logs = responsibility_logs
-            except:
-                dashboard.recent_responsibility_logs = self.env['tk.responsibility.log']
+        return list(self._classify_mixin_models()['accessible'])
+
+    def _get_log_statistics(self, datetime_from, datetime_to, recent_date):
+        """Compute general statistics, recent activity, top users and recent logs with one query per log model"""
+        ownership = self._summarize_log(
+            'tk.ownership.log', datetime_from, datetime_to, recent_date,
+            recent_condition=("action = %s", ['transfer']),
+            top_user=('user_id', "action = %s", ['transfer'])
+        )
+        assignment = self._summarize_log(
+            'tk.assignment.log', datetime_from, datetime_to, recent_date,
+            recent_condition=("action IN %s", [('assign', 'assign_multiple')]),
+            top_user=('user_id', "TRUE", [])
+        )
+        access = self._summarize_log(
+            'tk.access.log', datetime_from, datetime_to, recent_date,
+            recent_condition=("action LIKE %s", ['grant%'])
+        )
+        responsibility = self._summarize_log(
+            'tk.responsibility.log', datetime_from, datetime_to, recent_date,
+            recent_condition=("action IN %s", [('assign', 'delegate', 'transfer')]),
+            top_user=('new_responsible_user_id', "TRUE", [])
+        )
+
+        # Fetch the names of all top users at once; the users may belong to other companies,
+        # which the multi-company rules of res.users hide from the current user
+        user_ids = {summary[2] for summary in (ownership, assignment, responsibility) if summary[2]}
+        names = {user['id']: user['name'] for user in self.env['res.users'].sudo().browse(user_ids).read(['name'])}
+
+        return {
+            'total_ownership_changes': ownership[0],
+            'total_assignment_changes': assignment[0],
+            'total_access_changes': access[0],
+            'total_responsibility_changes': responsibility[0],
+            'recent_ownership_transfers': ownership[1],
+            'recent_new_assignments': assignment[1],
+            'recent_access_grants': access[1],
+            'recent_responsibility_changes': responsibility[1],
+            'top_ownership_transferrer': (
+                f"{names[ownership[2]]} ({ownership[3]} transfers)" if ownership[2] else "No transfers"
+            ),
+            'top_assigner': (
+                f"{names[assignment[2]]} ({assignment[3]} assignments)" if assignment[2] else "No assignments"
+            ),
+            'most_responsible_user': (
+                f"{names[responsibility[2]]} ({responsibility[3]} responsibilities)" if responsibility[2]
+                else "No responsibilities"
+            ),
+            'recent_ownership_logs': ownership[4],
+            'recent_assignment_logs': assignment[4],
+            'recent_access_logs': access[4],
+            'recent_responsibility_logs': responsibility[4],
+        }
+
+    def _summarize_log(self, model_name, datetime_from, datetime_to, recent_date, recent_condition, top_user=None):
+        """Summarize the log model ``model_name`` in a single query.
+
+        Returns ``(total, recent, top_user_id, top_user_count, recent_ids)`` where ``total``
+        counts the entries in [datetime_from, datetime_to), ``recent`` the entries since
+        ``recent_date`` matching the SQL ``recent_condition``, the top user is the value of the
+        column of ``top_user`` that appears most in the date range among the entries matching
+        its condition and ``recent_ids`` are the ids of the 10 latest entries since ``recent_date``.
+        Conditions are ``(sql, params)`` pairs on the ``action`` column.
+        """
+        model = self.env[model_name]
+        try:
+            model.check_access_rights('read')
+        except AccessError as e:
+            _logger.debug("Skipping statistics of %s: %s", model_name, e)
+            return 0, 0, None, None, []
+
+        table = model._table
+        user_column, top_condition, top_params = top_user or (None, "FALSE", [])
+        user_expr = f'"{table}"."{user_column}"' if user_column else "NULL::integer"
+        recent_sql, recent_params = recent_condition
+        # Only fetch the entries of the date range and of the recent period, record rules included
+        from_clause, where_clause, where_params = self._get_query_parts(model, [
+            '|', '&', ('create_date', '>=', datetime_from), ('create_date', '<', datetime_to),
+            ('create_date', '>=', recent_date)
+        ])
+        self.env.cr.execute(f"""
+            WITH logs AS (
+                SELECT "{table}".id, "{table}".create_date, "{table}".action, {user_expr} AS user_id
+                  FROM {from_clause}
+                 WHERE {where_clause}
+            )
+            SELECT counts.total, counts.recent, top.user_id, top.cnt, counts.recent_ids
+              FROM (
+                SELECT (SELECT COUNT(*) FROM logs
+                         WHERE create_date >= %s AND create_date < %s) AS total,
+                       (SELECT COUNT(*) FROM logs
+                         WHERE create_date >= %s AND {recent_sql}) AS recent,
+                       ARRAY(SELECT id FROM logs
+                              WHERE create_date >= %s
+                           ORDER BY create_date DESC, id DESC
+                              LIMIT 10) AS recent_ids
+              ) AS counts
+              LEFT JOIN (
+                SELECT user_id, COUNT(*) AS cnt
+                  FROM logs
+                 WHERE create_date >= %s AND create_date < %s AND user_id IS NOT NULL AND {top_condition}
+              GROUP BY user_id
+              ORDER BY cnt DESC, user_id
+                 LIMIT 1
+              ) AS top ON TRUE
+        """, [
+            *where_params,
+            datetime_from, datetime_to,
+            recent_date, *recent_params,
+            recent_date,
+            datetime_from, datetime_to, *top_params,
+        ])
+        return self.env.cr.fetchone()
+
+    def _get_stat_fields(self):
+        """Return the names of the fields computed by _compute_all"""
+        return [name for name, field in self._fields.items() if field.compute == '_compute_all']
+
+    def _get_date_range(self, today=None):
+        """Return the dashboard dates, falling back on the last 30 days before ``today``"""
+        self.ensure_one()
+        today = today or fields.Date.today()
+        return self.date_from or today - timedelta(days=30), self.date_to or today
+
+    def _get_cache_key(self, today=None):
+        """Return the (user, date from, date to) key of the cached statistics of this dashboard"""
+        return (self.env.uid, *self._get_date_range(today))
+
+    def _get_datetime_range(self, today=None):
+        """Return the half-open [from, to) datetime range covering the dashboard dates"""
+        date_from, date_to = self._get_date_range(today)
+        return fields.Datetime.to_datetime(date_from), fields.Datetime.to_datetime(date_to) + timedelta(days=1)
+
+    def _convert_from_cache(self, payload, check_exists=True):
+        """Convert a cached payload, where many2many fields hold lists of ids, to field values.
+
+        ``check_exists`` filters out the ids of logs deleted since the payload was cached.
+        """
+        values = {}
+        for name in self._get_stat_fields():
+            field = self._fields[name]
+            if field.type == 'many2many':
+                ids = payload[name]
+                if check_exists:
+                    ids = self.env[field.comodel_name].browse(ids).exists().ids
+                values[name] = [Command.set(ids)]
+            else:
+                values[name] = payload[name]
+        return values
 
     def refresh_dashboard(self):
         """Refresh dashboard data"""
-        # Recompute all computed fields
-        self._compute_statistics()
-        self._compute_user_statistics()
-        self._compute_recent_activity()
-        self._compute_top_users()
-        self._compute_recent_logs()
-        self._compute_current_status()
+        # Drop the cached statistics and read them back in one batch
+        cache = self.env['tk.dashboard.cache'].sudo()
+        for dashboard in self:
+            cache._clear_payload(*dashboard._get_cache_key())
+        stat_fields = self._get_stat_fields()
+        self.invalidate_recordset(stat_fields)
+        self.read(stat_fields)
 
         return {
             'type': 'ir.actions.client',
@@ -449,91 +541,56 @@ class ComprehensiveDashboard(models.TransientModel):
             }
         }
 
-    def action_view_ownership_logs(self):
-        """Open ownership logs view"""
+    def _log_action(self, model_name, title):
+        """Return the action opening the logs of ``model_name`` within the dashboard date range"""
+        datetime_from, datetime_to = self._get_datetime_range()
         return {
             'type': 'ir.actions.act_window',
-            'name': _('Ownership Logs'),
-            'res_model': 'tk.ownership.log',
+            'name': title,
+            'res_model': model_name,
             'view_mode': 'tree,form',
             'domain': [
-                ('create_date', '>=', self.date_from or fields.Date.today() - timedelta(days=30)),
-                ('create_date', '<=', self.date_to or fields.Date.today())
+                ('create_date', '>=', fields.Datetime.to_string(datetime_from)),
+                ('create_date', '<', fields.Datetime.to_string(datetime_to))
             ],
             'context': {'create': False}
         }
 
-    def action_view_assignment_logs(self):
-        """Open assignment logs view"""
+    def _my_log_action(self, model_name, user_field, title):
+        """Return the action opening the logs of ``model_name`` where ``user_field`` is the current user"""
         return {
             'type': 'ir.actions.act_window',
-            'name': _('Assignment Logs'),
-            'res_model': 'tk.assignment.log',
+            'name': title,
+            'res_model': model_name,
             'view_mode': 'tree,form',
-            'domain': [
-                ('create_date', '>=', self.date_from or fields.Date.today() - timedelta(days=30)),
-                ('create_date', '<=', self.date_to or fields.Date.today())
-            ],
-            'context': {'create': False}
+            'domain': [(user_field, '=', self.env.uid)],
+            'context': {f'default_{user_field}': self.env.uid}
         }
 
+    def action_view_ownership_logs(self):
+        """Open ownership logs view"""
+        return self._log_action('tk.ownership.log', _('Ownership Logs'))
+
+    def action_view_assignment_logs(self):
+        """Open assignment logs view"""
+        return self._log_action('tk.assignment.log', _('Assignment Logs'))
+
     def action_view_access_logs(self):
         """Open access logs view"""
-        return {
-            'type': 'ir.actions.act_window',
-            'name': _('Access Logs'),
-            'res_model': 'tk.access.log',
-            'view_mode': 'tree,form',
-            'domain': [
-                ('create_date', '>=', self.date_from or fields.Date.today() - timedelta(days=30)),
-                ('create_date', '<=', self.date_to or fields.Date.today())
-            ],
-            'context': {'create': False}
-        }
+        return self._log_action('tk.access.log', _('Access Logs'))
 
     def action_view_responsibility_logs(self):
         """Open responsibility logs view"""
-        return {
-            'type': 'ir.actions.act_window',
-            'name': _('Responsibility Logs'),
-            'res_model': 'tk.responsibility.log',
-            'view_mode': 'tree,form',
-            'domain': [
-                ('create_date', '>=', self.date_from or fields.Date.today() - timedelta(days=30)),
-                ('create_date', '<=', self.date_to or fields.Date.today())
-            ],
-            'context': {'create': False}
-        }
+        return self._log_action('tk.responsibility.log', _('Responsibility Logs'))
 
     def action_view_my_owned_records(self):
         """Open user's owned records"""
-        return {
-            'type': 'ir.actions.act_window',
-            'name': _('My Owned Records'),
-            'res_model': 'tk.ownership.log',
-            'view_mode': 'tree,form',
-            'domain': [('new_owner_id', '=', self.env.user.id)],
-            'context': {'default_new_owner_id': self.env.user.id}
-        }
+        return self._my_log_action('tk.ownership.log', 'new_owner_id', _('My Owned Records'))
 
     def action_view_my_assignments(self):
         """Open user's assignments"""
-        return {
-            'type': 'ir.actions.act_window',
-            'name': _('My Assignments'),
-            'res_model': 'tk.assignment.log',
-            'view_mode': 'tree,form',
-            'domain': [('new_assigned_user_id', '=', self.env.user.id)],
-            'context': {'default_new_assigned_user_id': self.env.user.id}
-        }
+        return self._my_log_action('tk.assignment.log', 'new_assigned_user_id', _('My Assignments'))
 
     def action_view_my_responsibilities(self):
         """Open user's responsibilities"""
-        return {
-            'type': 'ir.actions.act_window',
-            'name': _('My Responsibilities'),
-            'res_model': 'tk.responsibility.log',
-            'view_mode': 'tree,form',
-            'domain': [('new_responsible_user_id', '=', self.env.user.id)],
-            'context': {'default_new_responsible_user_id': self.env.user.id}
-        }
+        return self._my_log_action('tk.responsibility.log', 'new_responsible_user_id', _('My Responsibilities'))
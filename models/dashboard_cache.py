@@ -0,0 +1,87 @@
+import json
+from datetime import timedelta
+
+from odoo import models, fields, api, _
+
+
+class DashboardCache(models.Model):
+    _name = 'tk.dashboard.cache'
+    _description = 'Comprehensive Toolkit Dashboard Cache'
+    _order = 'computed_at desc'
+
+    # Cached statistics are considered fresh for this long
+    _ttl = timedelta(minutes=5)
+
+    user_id = fields.Many2one(
+        'res.users',
+        string='User',
+        required=True,
+        ondelete='cascade',
+        help="User for whom the statistics were computed"
+    )
+    date_from = fields.Date(
+        string='Date From',
+        required=True
+    )
+    date_to = fields.Date(
+        string='Date To',
+        required=True
+    )
+    computed_at = fields.Datetime(
+        string='Computed At',
+        required=True,
+        default=fields.Datetime.now,
+        help="When the cached statistics were computed"
+    )
+    payload = fields.Json(
+        string='Payload',
+        help="Cached dashboard statistics by field name"
+    )
+
+    _sql_constraints = [
+        ('dashboard_key_unique', 'unique(user_id, date_from, date_to)',
+         'Only one cached dashboard is allowed per user and date range.'),
+    ]
+
+    def _get_payload(self, user_id, date_from, date_to):
+        """Return the cached statistics for the given key, or an empty dict if missing or stale"""
+        self.env.cr.execute("""
+            SELECT payload
+              FROM tk_dashboard_cache
+             WHERE user_id = %s AND date_from = %s AND date_to = %s AND computed_at > %s
+        """, (user_id, date_from, date_to, fields.Datetime.now() - self._ttl))
+        row = self.env.cr.fetchone()
+        return (row and row[0]) or {}
+
+    def _set_payload(self, user_id, date_from, date_to, values):
+        """Merge ``values`` into the cached statistics for the given key.
+
+        A stale entry is replaced entirely and restarts the TTL, a fresh one keeps its
+        computation date so that merged sections never outlive the original entry.
+        """
+        now = fields.Datetime.now()
+        self.env.cr.execute("""
+            INSERT INTO tk_dashboard_cache (user_id, date_from, date_to, computed_at, payload)
+            VALUES (%s, %s, %s, %s, %s)
+            ON CONFLICT (user_id, date_from, date_to) DO UPDATE
+               SET payload = CASE WHEN tk_dashboard_cache.computed_at > %s
+                                  THEN tk_dashboard_cache.payload || EXCLUDED.payload
+                                  ELSE EXCLUDED.payload END,
+                   computed_at = CASE WHEN tk_dashboard_cache.computed_at > %s
+                                      THEN tk_dashboard_cache.computed_at
+                                      ELSE EXCLUDED.computed_at END
+        """, (user_id, date_from, date_to, now, json.dumps(values), now - self._ttl, now - self._ttl))
+
+    def _clear_payload(self, user_id, date_from, date_to):
+        """Drop the cached statistics for the given key"""
+        self.env.cr.execute("""
+            DELETE FROM tk_dashboard_cache
+             WHERE user_id = %s AND date_from = %s AND date_to = %s
+        """, (user_id, date_from, date_to))
+
+    @api.autovacuum
+    def _gc_stale_entries(self):
+        """Remove cached statistics that are past their TTL"""
+        self.env.cr.execute("""
+            DELETE FROM tk_dashboard_cache WHERE computed_at <= %s
+        """, (fields.Datetime.now() - self._ttl,))
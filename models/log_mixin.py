@@ -0,0 +1,102 @@
+from collections import defaultdict
+
+from odoo import models, api, tools
+from odoo.exceptions import AccessError
+from odoo.osv import expression
+
+
+class LogMixin(models.AbstractModel):
+    _name = 'tk.log.mixin'
+    _description = 'Log Mixin - Shared behavior of the change logs'
+
+    def _auto_init(self):
+        res = super()._auto_init()
+        if self._abstract:
+            return res
+        for suffix, columns, where in self._get_log_indexes():
+            tools.create_index(self._cr, f'{self._table}_{suffix}', self._table, columns, where=where)
+        # The date defaults to the creation date, which the creation date index already covers
+        tools.drop_index(self._cr, f'{self._table}_date_action_idx', self._table)
+        return res
+
+    def _get_log_indexes(self):
+        """Return the indexes of the log table as (name suffix, columns, where clause) tuples"""
+        return [
+            # History of a given record is looked up by model and record id
+            ('model_res_idx', ['model_name', 'res_id'], ''),
+            # Dashboard counters and recent logs filter on a creation date range, often combined with the action
+            ('create_date_action_idx', ['create_date', 'action'], ''),
+        ]
+
+    @api.model
+    def _search_display_name(self, operator, value):
+        """Search method for display_name, which is not stored"""
+        # Search on the model, record id, action label and date the display name is made of
+        negative = operator in expression.NEGATIVE_TERM_OPERATORS
+        positive_operator = expression.TERM_OPERATORS_NEGATION[operator] if negative else operator
+        domains = [[('model_name', operator, value)]]
+        if not isinstance(value, str):
+            return domains[0]
+
+        if value.isdigit():
+            domains.append([('res_id', '!=' if negative else '=', int(value))])
+        if positive_operator in ('like', 'ilike', '=like', '=ilike'):
+            # Datetimes are compared on their text form, e.g. "2024-05-01 10:00:00"
+            domains.append([('date', operator, value)])
+        if positive_operator in ('=', 'ilike'):
+            # Action labels are translated selection labels, match them in Python
+            actions = [
+                action for action, label in self._fields['action']._description_selection(self.env)
+                if (label == value if positive_operator == '=' else value.lower() in label.lower())
+            ]
+            if actions:
+                domains.append([('action', 'not in' if negative else 'in', actions)])
+
+        return expression.AND(domains) if negative else expression.OR(domains)
+
+    @api.depends('model_name', 'res_id')
+    def _compute_record_reference(self):
+        # Resolve the affected records of each model in one batch
+        res_ids_by_model = defaultdict(set)
+        for record in self:
+            if record.model_name and record.res_id:
+                res_ids_by_model[record.model_name].add(record.res_id)
+
+        names = {}
+        invalid_models = set()
+        for model_name, res_ids in res_ids_by_model.items():
+            if model_name not in self.env or self.env[model_name]._abstract:
+                invalid_models.add(model_name)
+                continue
+            targets = self.env[model_name].browse(res_ids).exists()
+            try:
+                names.update(zip(((model_name, res_id) for res_id in targets.ids), targets.mapped('display_name')))
+            except AccessError:
+                invalid_models.add(model_name)
+
+        for record in self:
+            if not (record.model_name and record.res_id):
+                record.record_reference = "N/A"
+            elif record.model_name in invalid_models:
+                record.record_reference = f"Invalid Model/ID: {record.model_name}/{record.res_id}"
+            elif (record.model_name, record.res_id) in names:
+                record.record_reference = names[(record.model_name, record.res_id)] or f"ID: {record.res_id}"
+            else:
+                record.record_reference = f"Deleted Record (ID: {record.res_id})"
+
+    def open_record(self):
+        """Open the related record"""
+        self.ensure_one()
+        if not self.model_name or not self.res_id:
+            return False
+
+        if self.model_name not in self.env:
+            return False
+
+        return {
+            'type': 'ir.actions.act_window',
+            'res_model': self.model_name,
+            'res_id': self.res_id,
+            'view_mode': 'form',
+            'target': 'current',
+        }
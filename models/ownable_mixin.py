@@ -1,6 +1,8 @@
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, _
 from odoo.exceptions import ValidationError, AccessError
 
+from .utils import is_current_user_admin
+
 
 class OwnableMixin(models.AbstractModel):
     _name = 'tk.ownable.mixin'
@@ -37,7 +39,6 @@ class OwnableMixin(models.AbstractModel):
     is_owned = fields.Boolean(
         string='Is Owned',
         compute='_compute_is_owned',
-        search='_search_is_owned',
         store=True,
         help="Whether this record has an owner"
     )
@@ -71,6 +72,17 @@ class OwnableMixin(models.AbstractModel):
         help="Whether current user owns or co-owns this record"
     )
 
+    def _auto_init(self):
+        res = super()._auto_init()
+        if not self._abstract:
+            # Unowned records are looked up by the dashboard; the condition matches the one
+            # generated for ('is_owned', '=', False) so that the planner can use the index
+            tools.create_index(
+                self._cr, f'{self._table}_unowned_idx', self._table, ['id'],
+                where='is_owned IS NULL OR is_owned = false'
+            )
+        return res
+
     @api.depends('owner_id', 'co_owner_ids')
     def _compute_is_owned(self):
         for record in self:
@@ -79,28 +91,28 @@ class OwnableMixin(models.AbstractModel):
 
     @api.depends('owner_id', 'co_owner_ids')
     def _compute_can_manage_co_owners(self):
+        uid = self.env.uid
+        is_admin = is_current_user_admin(self.env)
         for record in self:
             record.can_manage_co_owners = (
-                record.owner_id == self.env.user or
-                self.env.user in record.co_owner_ids or  # Co-owners can also manage co-owners
-                self.env.user.has_group('base.group_system')
+                is_admin or
+                record.owner_id.id == uid or
+                uid in record.co_owner_ids.ids  # Co-owners can also manage co-owners
             )
 
     @api.depends('owner_id')
     def _compute_can_transfer(self):
+        uid = self.env.uid
+        is_admin = is_current_user_admin(self.env)
         for record in self:
-            record.can_transfer = (
-                record.owner_id == self.env.user or
-                self.env.user.has_group('base.group_system')
-            )
+            record.can_transfer = is_admin or record.owner_id.id == uid
 
     @api.depends('owner_id')
     def _compute_can_release(self):
+        uid = self.env.uid
+        is_admin = is_current_user_admin(self.env)
         for record in self:
-            record.can_release = (
-                record.owner_id == self.env.user or
-                self.env.user.has_group('base.group_system')
-            )
+            record.can_release = is_admin or record.owner_id.id == uid
 
     @api.depends('co_owner_ids')
     def _compute_co_owner_count(self):
@@ -109,32 +121,32 @@ class OwnableMixin(models.AbstractModel):
 
     @api.depends('owner_id', 'co_owner_ids')
     def _compute_is_owned_by_me(self):
+        uid = self.env.uid
         for record in self:
             record.is_owned_by_me = (
-                record.owner_id == self.env.user or
-                self.env.user in record.co_owner_ids
+                record.owner_id.id == uid or
+                uid in record.co_owner_ids.ids
             )
 
     def transfer_ownership(self, new_owner_id, reason=None):
         """Transfer ownership to a new user"""
-        if not self.can_transfer:
+        if not all(self.mapped('can_transfer')):
             raise AccessError(_("You don't have permission to transfer ownership of this record."))
 
         new_owner = self.env['res.users'].browse(new_owner_id)
         if not new_owner.exists():
             raise ValidationError(_("Invalid new owner specified."))
 
-        old_owner = self.owner_id
-
-        # Update ownership
-        self.write({
-            'previous_owner_id': old_owner.id if old_owner else False,
-            'owner_id': new_owner_id,
-            'ownership_date': fields.Datetime.now()
-        })
-
-        # Log the transfer
-        self._log_ownership_change('transfer', old_owner, new_owner, reason)
+        # Update ownership and log the transfer, one batch per previous owner
+        now = fields.Datetime.now()
+        for old_owner, records in tools.groupby(self, key=lambda r: r.owner_id):
+            records = self.concat(*records)
+            records.write({
+                'previous_owner_id': old_owner.id,
+                'owner_id': new_owner.id,
+                'ownership_date': now
+            })
+            records._log_ownership_change('transfer', old_owner, new_owner, reason)
 
         return True
 
@@ -228,19 +240,20 @@ class OwnableMixin(models.AbstractModel):
         if not isinstance(user_ids, list):
             user_ids = [user_ids] if user_ids else []
 
-        users = self.env['res.users'].browse(user_ids)
-        if not all(user.exists() for user in users):
+        # Check all users in one query instead of one exists() per user, ignoring duplicates
+        users = self.env['res.users'].browse(list(dict.fromkeys(user_ids)))
+        if len(users.exists()) != len(users):
             raise ValidationError(_("One or more invalid users specified."))
 
         # Check for owner and existing co-owners
-        for user in users:
-            if user == self.owner_id:
-                raise ValidationError(_("The owner cannot be added as a co-owner."))
-            if user in self.co_owner_ids:
-                raise ValidationError(_("User %s is already a co-owner.") % user.name)
+        if self.owner_id & users:
+            raise ValidationError(_("The owner cannot be added as a co-owner."))
+        existing_co_owners = users & self.co_owner_ids
+        if existing_co_owners:
+            raise ValidationError(_("User %s is already a co-owner.") % existing_co_owners[0].name)
 
-        # Add all co-owners
-        self.co_owner_ids = [(4, user_id) for user_id in user_ids]
+        # Add all co-owners in a single write
+        self.write({'co_owner_ids': [(4, user_id) for user_id in users.ids]})
 
         # Log the addition with usernames
         user_names = ', '.join(users.mapped('name'))
@@ -284,53 +297,34 @@ class OwnableMixin(models.AbstractModel):
 
     def get_all_owners(self):
         """Get all owners (owner + co-owners) as a recordset"""
-        owners = self.env['res.users']
-        if self.owner_id:
-            owners |= self.owner_id
-        owners |= self.co_owner_ids
-        return owners
+        return self.mapped('owner_id') | self.mapped('co_owner_ids')
 
     def _log_ownership_change(self, action, old_owner, new_owner, reason):
-        """Log ownership changes"""
-        self.env['tk.ownership.log'].create({
+        """Log ownership changes, one entry per record created in a single batch"""
+        now = fields.Datetime.now()
+        self.env['tk.ownership.log'].create([{
             'model_name': self._name,
-            'res_id': self.id,
+            'res_id': record.id,
             'action': action,
             'old_owner_id': old_owner.id if old_owner else False,
             'new_owner_id': new_owner.id if new_owner else False,
             'reason': reason or '',
-            'user_id': self.env.user.id,
-            'date': fields.Datetime.now()
-        })
-
-    def _search_is_owned(self, operator, value):
-        """Search method for is_owned field"""
-        if operator == '=' and value:
-            # Records that have an owner OR co-owners
-            return ['|', ('owner_id', '!=', False), ('co_owner_ids', '!=', False)]
-        elif operator == '=' and not value:
-            # Records that have NO owner AND NO co-owners
-            return [('owner_id', '=', False), ('co_owner_ids', '=', False)]
-        elif operator == '!=' and value:
-            # Records that have NO owner AND NO co-owners
-            return [('owner_id', '=', False), ('co_owner_ids', '=', False)]
-        elif operator == '!=' and not value:
-            # Records that have an owner OR co-owners
-            return ['|', ('owner_id', '!=', False), ('co_owner_ids', '!=', False)]
-        return []
+            'user_id': self.env.uid,
+            'date': now
+        } for record in self])
 
     def _search_can_transfer(self, operator, value):
         """Search method for can_transfer field"""
         if operator == '=' and value:
             # Current user is owner or system admin
             domain = [('owner_id', '=', self.env.user.id)]
-            if self.env.user.has_group('base.group_system'):
+            if is_current_user_admin(self.env):
                 domain = ['|', ('owner_id', '=', self.env.user.id), ('owner_id', '!=', False)]
             return domain
         elif operator == '=' and not value:
             # Current user is NOT owner and not system admin
             domain = [('owner_id', '!=', self.env.user.id)]
-            if not self.env.user.has_group('base.group_system'):
+            if not is_current_user_admin(self.env):
                 domain.append(('owner_id', '!=', False))
             return domain
         return []
@@ -340,13 +334,13 @@ class OwnableMixin(models.AbstractModel):
         if operator == '=' and value:
             # Current user is owner or system admin
             domain = [('owner_id', '=', self.env.user.id)]
-            if self.env.user.has_group('base.group_system'):
+            if is_current_user_admin(self.env):
                 domain = ['|', ('owner_id', '=', self.env.user.id), ('owner_id', '!=', False)]
             return domain
         elif operator == '=' and not value:
             # Current user is NOT owner and not system admin
             domain = [('owner_id', '!=', self.env.user.id)]
-            if not self.env.user.has_group('base.group_system'):
+            if not is_current_user_admin(self.env):
                 domain.append(('owner_id', '!=', False))
             return domain
         return []
@@ -356,29 +350,30 @@ class OwnableMixin(models.AbstractModel):
         if operator == '=' and value:
             # Current user is owner or system admin
             domain = [('owner_id', '=', self.env.user.id)]
-            if self.env.user.has_group('base.group_system'):
+            if is_current_user_admin(self.env):
                 domain = ['|', ('owner_id', '=', self.env.user.id), ('owner_id', '!=', False)]
             return domain
         elif operator == '=' and not value:
             # Current user is NOT owner and not system admin
             domain = [('owner_id', '!=', self.env.user.id)]
-            if not self.env.user.has_group('base.group_system'):
+            if not is_current_user_admin(self.env):
                 domain.append(('owner_id', '!=', False))
             return domain
         return []
 
     def _search_is_owned_by_me(self, operator, value):
         """Search method for is_owned_by_me field"""
-        if operator == '=' and value:
+        uid = self.env.uid
+        # Match co-owned records with a single semi-join on the relation table
+        field = self._fields['co_owner_ids']
+        co_owned_query = (
+            f'SELECT "{field.column1}" FROM "{field.relation}" WHERE "{field.column2}" = %s',
+            [uid]
+        )
+        if operator == '=' and value or operator == '!=' and not value:
             # Current user is owner OR co-owner
-            return ['|', ('owner_id', '=', self.env.user.id), ('co_owner_ids', 'in', [self.env.user.id])]
-        elif operator == '=' and not value:
+            return ['|', ('owner_id', '=', uid), ('id', 'inselect', co_owned_query)]
+        elif operator == '=' and not value or operator == '!=' and value:
             # Current user is NOT owner AND NOT co-owner
-            return [('owner_id', '!=', self.env.user.id), ('co_owner_ids', 'not in', [self.env.user.id])]
-        elif operator == '!=' and value:
-            # Current user is NOT owner AND NOT co-owner
-            return [('owner_id', '!=', self.env.user.id), ('co_owner_ids', 'not in', [self.env.user.id])]
-        elif operator == '!=' and not value:
-            # Current user is owner OR co-owner
-            return ['|', ('owner_id', '=', self.env.user.id), ('co_owner_ids', 'in', [self.env.user.id])]
+            return [('owner_id', '!=', uid), ('id', 'not inselect', co_owned_query)]
         return []
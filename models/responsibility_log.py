@@ -3,6 +3,7 @@ from odoo import models, fields, api, _
 
 class ResponsibilityLog(models.Model):
     _name = 'tk.responsibility.log'
+    _inherit = 'tk.log.mixin'
     _description = 'Responsibility Change Log'
     _order = 'date desc'
     _rec_name = 'display_name'
@@ -65,7 +66,7 @@ class ResponsibilityLog(models.Model):
     display_name = fields.Char(
         string='Display Name',
         compute='_compute_display_name',
-        store=True
+        search='_search_display_name'
     )
     record_reference = fields.Char(
         string='Record Reference',
@@ -73,40 +74,16 @@ class ResponsibilityLog(models.Model):
         help="Reference to the affected record"
     )
 
+    def _get_log_indexes(self):
+        return super()._get_log_indexes() + [
+            # Top user statistics group the entries of a period by user
+            ('create_date_new_user_idx', ['create_date', 'new_responsible_user_id'], ''),
+        ]
+
     @api.depends('model_name', 'res_id', 'action', 'date')
     def _compute_display_name(self):
+        action_labels = dict(self._fields['action'].selection)
         for record in self:
-            action_label = dict(record._fields['action'].selection)[record.action]
-            record.display_name = f"{record.model_name} {record.res_id} - {action_label} ({record.date.strftime('%Y-%m-%d %H:%M')})"
-
-    @api.depends('model_name', 'res_id')
-    def _compute_record_reference(self):
-        for record in self:
-            if record.model_name and record.res_id:
-                try:
-                    target_record = self.env[record.model_name].browse(record.res_id)
-                    if target_record.exists():
-                        record.record_reference = target_record.display_name or f"ID: {record.res_id}"
-                    else:
-                        record.record_reference = f"Deleted Record (ID: {record.res_id})"
-                except:
-                    record.record_reference = f"Invalid Model/ID: {record.model_name}/{record.res_id}"
-            else:
-                record.record_reference = "N/A"
-
-    def open_record(self):
-        """Open the related record"""
-        self.ensure_one()
-        if not self.model_name or not self.res_id:
-            return False
-
-        try:
-            return {
-                'type': 'ir.actions.act_window',
-                'res_model': self.model_name,
-                'res_id': self.res_id,
-                'view_mode': 'form',
-                'target': 'current',
-            }
-        except:
-            return False
+            action_label = action_labels.get(record.action, '')
+            date_label = record.date.isoformat(sep=' ', timespec='minutes') if record.date else ''
+            record.display_name = f"{record.model_name} {record.res_id} - {action_label} ({date_label})"
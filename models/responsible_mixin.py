@@ -1,6 +1,8 @@
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, _
 from odoo.exceptions import ValidationError, AccessError
 
+from .utils import is_current_user_admin
+
 
 class ResponsibleMixin(models.AbstractModel):
     _name = 'tk.responsible.mixin'
@@ -59,6 +61,7 @@ class ResponsibleMixin(models.AbstractModel):
     is_responsibility_expired = fields.Boolean(
         string='Responsibility Expired',
         compute='_compute_is_responsibility_expired',
+        search='_search_is_responsibility_expired',
         help="Whether the responsibility has expired"
     )
     can_delegate = fields.Boolean(
@@ -78,23 +81,41 @@ class ResponsibleMixin(models.AbstractModel):
         help="Total number of secondary responsible users"
     )
 
+    def _auto_init(self):
+        res = super()._auto_init()
+        if not self._abstract:
+            # Expired responsibilities are searched on their end date, which most records leave empty
+            tools.create_index(
+                self._cr, f'{self._table}_responsibility_end_date_idx', self._table,
+                ['responsibility_end_date'], where='responsibility_end_date IS NOT NULL'
+            )
+        return res
+
     @api.depends('responsible_user_ids', 'responsibility_end_date')
     def _compute_is_responsibility_active(self):
         now = fields.Datetime.now()
         for record in self:
+            end_date = record.responsibility_end_date
             record.is_responsibility_active = (
-                bool(record.responsible_user_ids) and
-                (not record.responsibility_end_date or record.responsibility_end_date > now)
+                bool(record.responsible_user_ids) and (not end_date or end_date > now)
             )
 
     @api.depends('responsibility_end_date')
     def _compute_is_responsibility_expired(self):
         now = fields.Datetime.now()
         for record in self:
-            record.is_responsibility_expired = (
-                record.responsibility_end_date and
-                record.responsibility_end_date < now
-            )
+            end_date = record.responsibility_end_date
+            record.is_responsibility_expired = bool(end_date) and end_date < now
+
+    def _search_is_responsibility_expired(self, operator, value):
+        """Search method for is_responsibility_expired field"""
+        # The flag depends on the clock, so it is not stored; search on the end date instead
+        now = fields.Datetime.now()
+        if operator == '=' and value or operator == '!=' and not value:
+            return [('responsibility_end_date', '<', now)]
+        elif operator == '=' and not value or operator == '!=' and value:
+            return ['|', ('responsibility_end_date', '=', False), ('responsibility_end_date', '>=', now)]
+        return []
 
     @api.depends('responsible_user_ids')
     def _compute_responsibility_count(self):
@@ -107,48 +128,71 @@ class ResponsibleMixin(models.AbstractModel):
             record.secondary_responsibility_count = len(record.secondary_responsible_ids)
 
     def _compute_can_delegate(self):
-        for record in self:
-            # Basic permission check
-            has_basic_permission = (
-                self.env.user.has_group('base.group_user') or
-                self.env.user.has_group('base.group_system')
-            )
+        # The user and its groups are the same for every record
+        user = self.env.user
+        uid = user.id
+        is_system = is_current_user_admin(self.env)
+        has_basic_permission = is_system or user.has_group('base.group_user')
+        if not has_basic_permission or is_system:
+            self.can_delegate = has_basic_permission
+            return
+        user_group_ids = frozenset(user.sudo().groups_id.ids)
+
+        # Mixins combined with this one are the same for every record
+        has_owner = 'owner_id' in self._fields
+        has_co_owners = 'co_owner_ids' in self._fields
+        has_access_level = 'access_level' in self._fields
+        has_custom_groups = 'custom_access_group_ids' in self._fields
+
+        # Read the relations of the whole batch up front instead of record by record
+        self.mapped('responsible_user_ids')
+        self.mapped('secondary_responsible_ids')
+        if has_owner:
+            self.mapped('owner_id')
+        if has_co_owners:
+            self.mapped('co_owner_ids')
+        if has_access_level:
+            self.mapped('allowed_user_ids')
+            self.mapped('allowed_group_ids')
+        if has_custom_groups:
+            self.mapped('custom_access_group_ids.user_ids')
 
+        for record in self:
             # Check if user is currently responsible (primary OR secondary)
             is_responsible = (
-                self.env.user in record.responsible_user_ids or
-                self.env.user in record.secondary_responsible_ids
+                uid in record.responsible_user_ids.ids or
+                uid in record.secondary_responsible_ids.ids
             )
 
             # Check ownership if record has ownable mixin (including co-owners)
             has_ownership = False
-            if hasattr(record, 'owner_id'):
+            if has_owner:
                 has_ownership = (
-                    record.owner_id == self.env.user or
-                    (hasattr(record, 'co_owner_ids') and self.env.user in record.co_owner_ids) or
+                    record.owner_id.id == uid or
+                    (has_co_owners and uid in record.co_owner_ids.ids) or
                     not record.owner_id  # Unowned records can be delegated
                 )
 
             # Check access permissions if record has accessible mixin
             has_access = True  # Default to True if no access control
-            if hasattr(record, 'access_level'):
-                if record.access_level == 'private' and hasattr(record, 'owner_id'):
+            if has_access_level:
+                if record.access_level == 'private' and has_owner:
                     has_access = (
-                        record.owner_id == self.env.user or
-                        (hasattr(record, 'co_owner_ids') and self.env.user in record.co_owner_ids)
+                        record.owner_id.id == uid or
+                        (has_co_owners and uid in record.co_owner_ids.ids)
                     )
                 elif record.access_level == 'restricted':
                     has_access = (
-                        self.env.user in record.allowed_user_ids or
-                        any(group in self.env.user.groups_id for group in record.allowed_group_ids) or
-                        (hasattr(record, 'owner_id') and record.owner_id == self.env.user) or
-                        (hasattr(record, 'co_owner_ids') and self.env.user in record.co_owner_ids)
+                        uid in record.allowed_user_ids.ids or
+                        not user_group_ids.isdisjoint(record.allowed_group_ids.ids) or
+                        (has_owner and record.owner_id.id == uid) or
+                        (has_co_owners and uid in record.co_owner_ids.ids)
                     )
 
                     # Check custom access groups if available
-                    if not has_access and hasattr(record, 'custom_access_group_ids'):
+                    if not has_access and has_custom_groups:
                         for custom_group in record.custom_access_group_ids:
-                            if custom_group.active and self.env.user in custom_group.user_ids:
+                            if custom_group.active and uid in custom_group.user_ids.ids:
                                 has_access = True
                                 break
 
@@ -156,15 +200,12 @@ class ResponsibleMixin(models.AbstractModel):
                     has_access = True
 
             # User can delegate if they have basic permission AND (is responsible OR ownership OR access)
-            record.can_delegate = (
-                has_basic_permission and
-                (is_responsible or has_ownership or has_access or self.env.user.has_group('base.group_system'))
-            )
+            record.can_delegate = is_responsible or has_ownership or has_access
 
     def assign_responsibility(self, user_ids, responsibility_type='primary',
                             end_date=None, description=None, reason=None):
         """Assign responsibility to users"""
-        if not self.can_delegate and not self.env.user.has_group('base.group_system'):
+        if not all(self.mapped('can_delegate')) and not is_current_user_admin(self.env):
             raise AccessError(_("You don't have permission to assign responsibility for this record."))
 
         if not user_ids:
@@ -175,10 +216,14 @@ class ResponsibleMixin(models.AbstractModel):
             user_ids = [user_ids] if user_ids else []
 
         users = self.env['res.users'].browse(user_ids)
-        if not all(user.exists() for user in users):
+        if users - users.exists():
             raise ValidationError(_("One or more invalid users specified for responsibility assignment."))
 
-        old_responsible = self.responsible_user_ids
+        # Records previously held by the same users are logged together
+        records_by_old_responsible = [
+            (old_responsible, self.concat(*records))
+            for old_responsible, records in tools.groupby(self, key=lambda r: r.responsible_user_ids)
+        ]
 
         # Assign responsibility
         vals = {
@@ -195,20 +240,25 @@ class ResponsibleMixin(models.AbstractModel):
         self.write(vals)
 
         # Log the assignment
-        self._log_responsibility_change('assign_multiple', old_responsible, users, reason)
+        for old_responsible, records in records_by_old_responsible:
+            records._log_responsibility_change('assign_multiple', old_responsible, users, reason)
 
         return True
 
     def delegate_responsibility(self, user_ids, reason=None):
         """Delegate responsibility to other users"""
-        if not self.can_delegate:
+        if not all(self.mapped('can_delegate')):
             raise AccessError(_("You don't have permission to delegate responsibility."))
 
         users = self.env['res.users'].browse(user_ids)
-        if not all(user.exists() for user in users):
+        if users - users.exists():
             raise ValidationError(_("One or more invalid users specified for delegation."))
 
-        old_responsible = self.responsible_user_ids
+        # Records previously held by the same users are logged together
+        records_by_old_responsible = [
+            (old_responsible, self.concat(*records))
+            for old_responsible, records in tools.groupby(self, key=lambda r: r.responsible_user_ids)
+        ]
 
         # Delegate responsibility
         vals = {
@@ -220,60 +270,71 @@ class ResponsibleMixin(models.AbstractModel):
         self.write(vals)
 
         # Log the delegation
-        self._log_responsibility_change('delegate_multiple', old_responsible, users, reason)
+        for old_responsible, records in records_by_old_responsible:
+            records._log_responsibility_change('delegate_multiple', old_responsible, users, reason)
 
         return True
 
     def add_responsible_user(self, user_id, is_secondary=False, reason=None):
         """Add a responsible user"""
-        if not self.can_delegate:
+        if not all(self.mapped('can_delegate')):
             raise AccessError(_("You don't have permission to add responsible users."))
 
         user = self.env['res.users'].browse(user_id)
         if not user.exists():
             raise ValidationError(_("Invalid user specified."))
 
+        # Link the user to every record missing it with a single write and log batch
         if is_secondary:
-            if user not in self.secondary_responsible_ids:
-                self.secondary_responsible_ids = [(4, user_id)]
-                self._log_responsibility_change('add_secondary', None, user, reason)
+            missing = self.filtered(lambda r: user.id not in r.secondary_responsible_ids.ids)
+            if missing:
+                missing.write({'secondary_responsible_ids': [(4, user.id)]})
+                missing._log_responsibility_change('add_secondary', None, user, reason)
         else:
-            if user not in self.responsible_user_ids:
-                self.responsible_user_ids = [(4, user_id)]
-                self._log_responsibility_change('add_responsible', None, user, reason)
+            missing = self.filtered(lambda r: user.id not in r.responsible_user_ids.ids)
+            if missing:
+                missing.write({'responsible_user_ids': [(4, user.id)]})
+                missing._log_responsibility_change('add_responsible', None, user, reason)
 
         return True
 
     def remove_responsible_user(self, user_id, is_secondary=False, reason=None):
         """Remove a responsible user"""
-        if not self.can_delegate:
+        if not all(self.mapped('can_delegate')):
             raise AccessError(_("You don't have permission to remove responsible users."))
 
         user = self.env['res.users'].browse(user_id)
         if not user.exists():
             raise ValidationError(_("Invalid user specified."))
 
+        # Unlink the user from every record holding it with a single write and log batch
         if is_secondary:
-            if user in self.secondary_responsible_ids:
-                self.secondary_responsible_ids = [(3, user_id)]
-                self._log_responsibility_change('remove_secondary', user, None, reason)
+            holding = self.filtered(lambda r: user.id in r.secondary_responsible_ids.ids)
+            if holding:
+                holding.write({'secondary_responsible_ids': [(3, user.id)]})
+                holding._log_responsibility_change('remove_secondary', user, None, reason)
         else:
-            if user in self.responsible_user_ids:
-                self.responsible_user_ids = [(3, user_id)]
-                self._log_responsibility_change('remove_responsible', user, None, reason)
+            holding = self.filtered(lambda r: user.id in r.responsible_user_ids.ids)
+            if holding:
+                holding.write({'responsible_user_ids': [(3, user.id)]})
+                holding._log_responsibility_change('remove_responsible', user, None, reason)
 
         return True
 
     def transfer_responsibility(self, user_ids, reason=None):
         """Transfer responsibility to other users"""
-        if not self.can_delegate:
+        if not all(self.mapped('can_delegate')):
             raise AccessError(_("You don't have permission to transfer responsibility."))
 
         users = self.env['res.users'].browse(user_ids)
-        if not all(user.exists() for user in users):
+        if users - users.exists():
             raise ValidationError(_("One or more invalid users specified for transfer."))
 
-        old_responsible = self.responsible_user_ids
+        # Records previously held by the same users are logged together
+        records_by_old_responsible = [
+            (old_responsible, self.concat(*records))
+            for old_responsible, records in tools.groupby(self, key=lambda r: r.responsible_user_ids)
+        ]
 
         # Transfer responsibility
         vals = {
@@ -285,17 +346,23 @@ class ResponsibleMixin(models.AbstractModel):
         self.write(vals)
 
         # Log the transfer
-        self._log_responsibility_change('transfer_multiple', old_responsible, users, reason)
+        for old_responsible, records in records_by_old_responsible:
+            records._log_responsibility_change('transfer_multiple', old_responsible, users, reason)
 
         return True
 
     def revoke_all_responsibility(self, reason=None):
         """Revoke all responsibility"""
-        if not self.can_delegate:
+        if not all(self.mapped('can_delegate')):
             raise AccessError(_("You don't have permission to revoke responsibility."))
 
-        old_responsible = self.responsible_user_ids
-        old_secondary = self.secondary_responsible_ids
+        # Records previously held by the same users are logged together
+        records_by_old_users = [
+            (old_users, self.concat(*records))
+            for old_users, records in tools.groupby(
+                self, key=lambda r: r.responsible_user_ids | r.secondary_responsible_ids)
+            if old_users
+        ]
 
         # Revoke all responsibility
         self.write({
@@ -304,21 +371,25 @@ class ResponsibleMixin(models.AbstractModel):
         })
 
         # Log the revocation
-        if old_responsible or old_secondary:
-            self._log_responsibility_change('revoke_all', old_responsible | old_secondary, None, reason)
+        for old_users, records in records_by_old_users:
+            records._log_responsibility_change('revoke_all', old_users, None, reason)
 
         return True
 
     def escalate_responsibility(self, escalation_user_id, reason=None):
         """Escalate responsibility to a higher authority"""
-        if not self.can_delegate:
+        if not all(self.mapped('can_delegate')):
             raise AccessError(_("You don't have permission to escalate responsibility."))
 
         escalation_user = self.env['res.users'].browse(escalation_user_id)
         if not escalation_user.exists():
             raise ValidationError(_("Invalid escalation user specified."))
 
-        old_responsible = self.responsible_user_ids
+        # Records previously held by the same users are logged together
+        records_by_old_responsible = [
+            (old_responsible, self.concat(*records))
+            for old_responsible, records in tools.groupby(self, key=lambda r: r.responsible_user_ids)
+        ]
 
         # Escalate responsibility
         vals = {
@@ -331,62 +402,57 @@ class ResponsibleMixin(models.AbstractModel):
         self.write(vals)
 
         # Log the escalation
-        self._log_responsibility_change('escalate', old_responsible, escalation_user, reason)
+        for old_responsible, records in records_by_old_responsible:
+            records._log_responsibility_change('escalate', old_responsible, escalation_user, reason)
 
         return True
 
     def _log_responsibility_change(self, action, old_users, new_users, reason):
         """Log responsibility changes"""
-        old_user_names = []
-        new_user_names = []
-
-        if old_users:
-            if hasattr(old_users, '__iter__'):
-                old_user_names = [user.name for user in old_users]
-            else:
-                old_user_names = [old_users.name]
-
-        if new_users:
-            if hasattr(new_users, '__iter__'):
-                new_user_names = [user.name for user in new_users]
-            else:
-                new_user_names = [new_users.name]
-
-        extra_info = ""
-        if old_user_names:
-            extra_info += f"Previous: {', '.join(old_user_names)}"
-        if new_user_names:
-            if extra_info:
-                extra_info += " | "
-            extra_info += f"New: {', '.join(new_user_names)}"
-
-        self.env['tk.responsibility.log'].create({
+        # The users are shared by every record, read their names once
+        old_user_names = old_users.mapped('name') if old_users else []
+        new_user_names = new_users.mapped('name') if new_users else []
+
+        extra_info = " | ".join(filter(None, [
+            old_user_names and f"Previous: {', '.join(old_user_names)}",
+            new_user_names and f"New: {', '.join(new_user_names)}",
+        ]))
+
+        # One entry per record, created in a single batch
+        common_vals = {
             'model_name': self._name,
-            'res_id': self.id,
             'action': action,
-            'old_responsible_user_id': old_users[0].id if old_users and len(old_users) > 0 else False,
-            'new_responsible_user_id': new_users[0].id if new_users and len(new_users) > 0 else False,
+            'old_responsible_user_id': old_users[:1].id if old_users else False,
+            'new_responsible_user_id': new_users[:1].id if new_users else False,
             'reason': reason or '',
             'extra_info': extra_info,
-            'user_id': self.env.user.id,
-            'date': fields.Datetime.now()
-        })
+            'user_id': self.env.uid,
+            'date': fields.Datetime.now(),
+        }
+        self.env['tk.responsibility.log'].create([
+            dict(common_vals, res_id=record.id) for record in self
+        ])
 
     def _search_can_delegate(self, operator, value):
         """Search method for can_delegate field"""
         # This is a complex computed field, return basic domain
         if operator == '=' and value:
             # Records where user has some level of access
-            domain = []
-            if self.env.user.has_group('base.group_system'):
-                domain = [('id', '!=', False)]  # System admin can delegate any record
-            else:
-                # Basic users can delegate records they're responsible for or own
-                domain = ['|',
-                         ('responsible_user_ids', 'in', [self.env.user.id]),
-                         '|', ('secondary_responsible_ids', 'in', [self.env.user.id]),
-                         '|', ('owner_id', '=', self.env.user.id),
-                         ('co_owner_ids', 'in', [self.env.user.id])]
+            if is_current_user_admin(self.env):
+                return [('id', '!=', False)]  # System admin can delegate any record
+            # Basic users can delegate records they're responsible for or own,
+            # matched with a single semi-join over the user relation tables
+            uid = self.env.uid
+            relation_fields = ['responsible_user_ids', 'secondary_responsible_ids']
+            if 'co_owner_ids' in self._fields:
+                relation_fields.append('co_owner_ids')
+            subqueries = []
+            for field_name in relation_fields:
+                field = self._fields[field_name]
+                subqueries.append(f'SELECT "{field.column1}" FROM "{field.relation}" WHERE "{field.column2}" = %s')
+            domain = [('id', 'inselect', (' UNION '.join(subqueries), [uid] * len(subqueries)))]
+            if 'owner_id' in self._fields:
+                domain = ['|', ('owner_id', '=', uid)] + domain
             return domain
         elif operator == '=' and not value:
             # Records where user cannot delegate (complex logic, return restrictive domain)
@@ -0,0 +1,4 @@
+def is_current_user_admin(env):
+    """Whether the current user of ``env`` is a system administrator"""
+    # has_group is ormcached per user and group, so this costs no query once warm
+    return env.user.has_group('base.group_system')
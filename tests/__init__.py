@@ -0,0 +1,3 @@
+from . import test_dashboard_cache
+from . import test_dashboard_counts
+from . import test_bulk_operation_wizards
@@ -0,0 +1,21 @@
+from odoo.exceptions import ValidationError
+from odoo.tests.common import TransactionCase
+
+from ..wizard.bulk_operation_wizards import _parse_record_ids
+
+
+class TestParseRecordIds(TransactionCase):
+
+    def test_parse_lists(self):
+        """Test that JSON, Python literals and lists are parsed without duplicates"""
+        self.assertEqual(_parse_record_ids('[3, 1, 3]'), [3, 1])
+        self.assertEqual(_parse_record_ids('(1, 2,)'), [1, 2])
+        self.assertEqual(_parse_record_ids([4, 4, 5]), [4, 5])
+        self.assertEqual(_parse_record_ids(False), [])
+        self.assertEqual(_parse_record_ids(None), [])
+
+    def test_reject_invalid_values(self):
+        """Test that anything but a list of integers is rejected"""
+        for value in ['[true]', [True], '[1.5]', '{"a": 1}', 'not a list', '__import__("os")']:
+            with self.subTest(value=value), self.assertRaises(ValidationError):
+                _parse_record_ids(value)
@@ -0,0 +1,66 @@
+from datetime import date
+
+from odoo import fields
+from odoo.tests.common import TransactionCase
+
+
+class TestDashboardCache(TransactionCase):
+
+    def setUp(self):
+        super().setUp()
+        self.cache = self.env['tk.dashboard.cache'].sudo()
+        self.key = (self.env.uid, date(2024, 1, 1), date(2024, 1, 31))
+
+    def test_payload_round_trip(self):
+        """Test that a stored payload is read back and merged with later sections"""
+        self.assertEqual(self.cache._get_payload(*self.key), {})
+
+        self.cache._set_payload(*self.key, {'total_ownership_changes': 3})
+        self.cache._set_payload(*self.key, {'total_access_changes': 5})
+
+        self.assertEqual(self.cache._get_payload(*self.key), {
+            'total_ownership_changes': 3,
+            'total_access_changes': 5,
+        })
+
+    def test_stale_payload(self):
+        """Test that a payload past its TTL is ignored and replaced entirely"""
+        self.cache._set_payload(*self.key, {'total_ownership_changes': 3})
+        self.env.cr.execute(
+            "UPDATE tk_dashboard_cache SET computed_at = %s WHERE user_id = %s",
+            [fields.Datetime.now() - self.cache._ttl, self.env.uid]
+        )
+        self.assertEqual(self.cache._get_payload(*self.key), {})
+
+        self.cache._set_payload(*self.key, {'total_access_changes': 5})
+        self.assertEqual(self.cache._get_payload(*self.key), {'total_access_changes': 5})
+
+    def test_clear_payload(self):
+        """Test that clearing a payload only drops the given key"""
+        other_key = (self.env.uid, date(2024, 2, 1), date(2024, 2, 29))
+        self.cache._set_payload(*self.key, {'total_ownership_changes': 3})
+        self.cache._set_payload(*other_key, {'total_ownership_changes': 4})
+
+        self.cache._clear_payload(*self.key)
+
+        self.assertEqual(self.cache._get_payload(*self.key), {})
+        self.assertEqual(self.cache._get_payload(*other_key), {'total_ownership_changes': 4})
+
+    def test_dashboard_cache_hit_and_refresh(self):
+        """Test that the dashboard reads fresh cached statistics until it is refreshed"""
+        dashboard = self.env['tk.comprehensive.dashboard'].create({
+            'date_from': self.key[1],
+            'date_to': self.key[2],
+        })
+        computed = dashboard.total_ownership_changes
+        payload = self.cache._get_payload(*dashboard._get_cache_key())
+        self.assertEqual(payload.get('total_ownership_changes'), computed)
+
+        # A fresh cached value is used as is
+        self.cache._set_payload(*dashboard._get_cache_key(), {'total_ownership_changes': computed + 1000})
+        dashboard.invalidate_recordset()
+        self.assertEqual(dashboard.total_ownership_changes, computed + 1000)
+
+        # Refreshing drops the cached statistics and computes them again
+        dashboard.refresh_dashboard()
+        self.assertEqual(dashboard.total_ownership_changes, computed)
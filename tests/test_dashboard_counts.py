@@ -0,0 +1,47 @@
+from odoo.tests.common import TransactionCase
+
+
+class TestDashboardCounts(TransactionCase):
+
+    def setUp(self):
+        super().setUp()
+        self.counted_group = self.env['res.groups'].create({'name': 'Toolkit Counted Group'})
+        rule_group = self.env['res.groups'].create({'name': 'Toolkit Rule Group'})
+        self.reader = self.env['res.users'].create({
+            'name': 'Toolkit Reader',
+            'login': 'tk_reader',
+            'groups_id': [(6, 0, [self.env.ref('base.group_user').id, rule_group.id])],
+        })
+        self.env['res.users'].create([{
+            'name': name,
+            'login': login,
+            'groups_id': [(6, 0, [self.counted_group.id])],
+        } for name, login in [('Toolkit Visible', 'tk_visible'), ('Toolkit Hidden', 'tk_hidden')]])
+
+        # The name of a user is stored on its partner, so the rule joins res_partner
+        self.env['ir.rule'].create({
+            'name': 'Toolkit: visible users only',
+            'model_id': self.env.ref('base.model_res_users').id,
+            'groups': [(4, rule_group.id)],
+            'domain_force': "[('name', '=', 'Toolkit Visible')]",
+        })
+        self.dashboard = self.env['tk.comprehensive.dashboard'].with_user(self.reader)
+        self.users = self.env['res.users'].with_user(self.reader)
+
+    def test_count_user_links_under_rule_with_join(self):
+        """Test that the link counts apply record rules joining another table"""
+        counts = self.dashboard._count_user_links([self.users], 'groups_id', self.counted_group.id)
+        self.assertEqual(sum(counts.values()), 1)
+
+    def test_count_user_links_grouped(self):
+        """Test that the params of the grouping expression and of the rule stay in order"""
+        counts = self.dashboard._count_user_links(
+            [self.users], 'groups_id', self.counted_group.id,
+            group_expr='"{table}".login = %s', group_params=['tk_visible']
+        )
+        self.assertEqual(counts, {True: 1})
+
+    def test_count_across_models_under_rule(self):
+        """Test that the record counts apply record rules"""
+        count = self.dashboard._count_across_models([self.users], [('login', 'in', ['tk_visible', 'tk_hidden'])])
+        self.assertEqual(count, 1)
@@ -1,5 +1,6 @@
 from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError
+from odoo.fields import Command
 
 
 class AccessibleGroupWizard(models.TransientModel):
@@ -123,8 +124,10 @@ class AccessibleGroupWizard(models.TransientModel):
     def _onchange_existing_group_id(self):
         """Copy users from existing group"""
         if self.existing_group_id:
-            self.user_ids = [(6, 0, self.existing_group_id.user_ids.ids)]
-            self.manager_ids = [(6, 0, self.existing_group_id.manager_ids.ids)]
+            self.update({
+                'user_ids': self.existing_group_id.user_ids,
+                'manager_ids': self.existing_group_id.manager_ids,
+            })
 
     def _prepare_group_values(self):
         """Prepare values for group creation"""
@@ -133,16 +136,16 @@ class AccessibleGroupWizard(models.TransientModel):
             'description': self.description,
             'group_type': self.group_type,
             'access_level': self.access_level,
-            'user_ids': [(6, 0, self.user_ids.ids)],
+            'user_ids': [Command.set(self.user_ids.ids)],
         }
 
         # Add managers
-        manager_ids = list(self.manager_ids.ids)
-        if self.auto_add_creator_as_manager and self.env.user.id not in manager_ids:
-            manager_ids.append(self.env.user.id)
+        manager_ids = set(self.manager_ids.ids)
+        if self.auto_add_creator_as_manager:
+            manager_ids.add(self.env.uid)
 
         if manager_ids:
-            vals['manager_ids'] = [(6, 0, manager_ids)]
+            vals['manager_ids'] = [Command.set(list(manager_ids))]
 
         # Handle temporary groups
         if self.is_temporary:
@@ -153,10 +156,13 @@ class AccessibleGroupWizard(models.TransientModel):
 
         return vals
 
+    def _create_group(self):
+        """Create one access group per wizard in a single batch"""
+        return self.env['tk.accessible.group'].create([wizard._prepare_group_values() for wizard in self])
+
     def action_create_group(self):
         """Create the access group"""
-        vals = self._prepare_group_values()
-        group = self.env['tk.accessible.group'].create(vals)
+        group = self._create_group()
 
         return {
             'type': 'ir.actions.act_window',
@@ -169,8 +175,7 @@ class AccessibleGroupWizard(models.TransientModel):
 
     def action_create_and_assign(self):
         """Create group and assign to current record"""
-        vals = self._prepare_group_values()
-        group = self.env['tk.accessible.group'].create(vals)
+        group = self._create_group()
 
         # If called from a specific record context, assign the group
         active_model = self.env.context.get('active_model')
@@ -179,7 +184,7 @@ class AccessibleGroupWizard(models.TransientModel):
         if active_model and active_id:
             record = self.env[active_model].browse(active_id)
             if hasattr(record, 'tk_access_group_ids'):
-                record.tk_access_group_ids = [(4, group.id)]
+                record.tk_access_group_ids = [Command.link(group.id)]
 
         return {
             'type': 'ir.actions.client',
@@ -192,8 +197,7 @@ class AccessibleGroupWizard(models.TransientModel):
 
     def action_create_and_close(self):
         """Create group and close wizard"""
-        vals = self._prepare_group_values()
-        group = self.env['tk.accessible.group'].create(vals)
+        group = self._create_group()
 
         return {
             'type': 'ir.actions.client',
@@ -206,8 +210,7 @@ class AccessibleGroupWizard(models.TransientModel):
 
     def action_create_and_new(self):
         """Create group and open wizard for creating another"""
-        vals = self._prepare_group_values()
-        group = self.env['tk.accessible.group'].create(vals)
+        self._create_group()
 
         # Return action to open new wizard
         return {
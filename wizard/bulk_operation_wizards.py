@@ -1,6 +1,99 @@
+import ast
+import json
+
 from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError
 
+# Number of records processed together by the bulk wizards
+BATCH_SIZE = 10000
+# Number of failed records named in the result notification of the bulk wizards
+ERROR_DISPLAY_LIMIT = 20
+
+
+def _parse_record_ids(value):
+    """Parse the record ids of a bulk wizard, given as a list or stored as a JSON or Python list literal"""
+    if not value:
+        return []
+    if isinstance(value, (list, tuple)):
+        record_ids = value
+    else:
+        try:
+            record_ids = json.loads(value)
+        except ValueError:
+            # Lists serialized with repr(), e.g. tuples or trailing commas
+            try:
+                record_ids = ast.literal_eval(value)
+            except (ValueError, SyntaxError):
+                record_ids = None
+    # bool is a subclass of int, reject it so that true is not read as record 1
+    if not isinstance(record_ids, (list, tuple)) or not all(
+            isinstance(i, int) and not isinstance(i, bool) for i in record_ids):
+        raise ValidationError(_("Record IDs must be a list of integers."))
+    # Drop duplicated ids so that no record is processed twice
+    return list(dict.fromkeys(record_ids))
+
+
+def _split_failures(records, operation):
+    """Run ``operation`` on ``records`` in a savepoint, splitting them in halves when it fails.
+
+    Returns the number of processed records and the ``(id, error)`` pairs of the failed ones.
+    """
+    try:
+        with records.env.cr.savepoint():
+            operation(records)
+        return len(records), []
+    except Exception as e:
+        if len(records) == 1:
+            return 0, [(records.id, str(e))]
+
+    # Bisect so that a few failures cost a few savepoints instead of one per record
+    middle = len(records) // 2
+    head_count, head_failures = _split_failures(records[:middle], operation)
+    tail_count, tail_failures = _split_failures(records[middle:], operation)
+    return head_count + tail_count, head_failures + tail_failures
+
+
+def _run_in_savepoints(records, operation):
+    """Run ``operation`` on all ``records`` at once, isolating the failed records if that fails.
+
+    Every attempt runs in a savepoint so that a failure leaves no partial change behind.
+    Returns the number of processed records and the error messages of the failed ones.
+    """
+    success_count, failures = _split_failures(records, operation)
+    return success_count, _format_failures(records, failures)
+
+
+def _format_failures(records, failures):
+    """Return the messages of ``failures``, ``(id, error)`` pairs of ``records`` where the error may be empty.
+
+    Only the first ERROR_DISPLAY_LIMIT records are named, in one batch, the others are counted.
+    """
+    shown = failures[:ERROR_DISPLAY_LIMIT]
+    names = dict(records.browse([record_id for record_id, error in shown]).name_get())
+    error_records = [
+        f"{names.get(record_id, record_id)}: {error}" if error else str(names.get(record_id, record_id))
+        for record_id, error in shown
+    ]
+    if len(failures) > len(shown):
+        error_records.append(_("%s more records") % (len(failures) - len(shown)))
+    return error_records
+
+
+def _run_in_batches(records, operation):
+    """Run ``operation`` on ``records`` in batches of BATCH_SIZE records, see _run_in_savepoints"""
+    success_count = 0
+    error_records = []
+    for index in range(0, len(records), BATCH_SIZE):
+        if index:
+            # Drop the cache of the previous batch, already flushed by its savepoint
+            records.env.invalidate_all()
+        # Browse each batch on its own so that prefetching stays within the batch
+        batch = records.browse(records._ids[index:index + BATCH_SIZE])
+        batch_success_count, batch_error_records = _run_in_savepoints(batch, operation)
+        success_count += batch_success_count
+        error_records += batch_error_records
+    return success_count, error_records
+
 
 class BulkAssignWizard(models.TransientModel):
     _name = 'tk.bulk.assign.wizard'
@@ -19,37 +112,42 @@ class BulkAssignWizard(models.TransientModel):
     ], string='Priority', default='normal')
     reason = fields.Text(string='Reason')
 
+    def _assign_records(self, records):
+        """Assign the users of the wizard to the given records"""
+        records.assign_to_users(
+            user_ids=self.user_ids.ids,
+            deadline=self.assignment_deadline,
+            description=self.assignment_description,
+            priority=self.assignment_priority,
+            reason=self.reason
+        )
+
     def action_assign(self):
         """Bulk assign users to selected records"""
         self.ensure_one()
 
         # Parse record IDs
-        record_ids = eval(self.record_ids) if self.record_ids else []
+        record_ids = _parse_record_ids(self.record_ids) or _parse_record_ids(self.env.context.get('active_ids'))
         if not record_ids:
             raise ValidationError(_("No records selected for assignment."))
 
-        # Get the records
+        # Get the records, dropping the ones deleted meanwhile with a single query
         records = self.env[self.model_name].browse(record_ids)
-
-        # Assign users to each record
-        success_count = 0
-        error_records = []
-
-        for record in records:
-            try:
-                if hasattr(record, 'assign_to_users'):
-                    record.assign_to_users(
-                        user_ids=self.user_ids.ids,
-                        deadline=self.assignment_deadline,
-                        description=self.assignment_description,
-                        priority=self.assignment_priority,
-                        reason=self.reason
-                    )
-                    success_count += 1
-                else:
-                    error_records.append(record.display_name)
-            except Exception as e:
-                error_records.append(f"{record.display_name}: {str(e)}")
+        existing = records.exists()
+        missing_ids = sorted(set(records.ids) - set(existing.ids))
+        records = existing
+        if not records:
+            raise ValidationError(_("None of the selected records exist anymore."))
+
+        # All records share the same model, check its support once
+        if not hasattr(records, 'assign_to_users'):
+            # Name the records like failures without an error message
+            success_count, error_records = 0, _format_failures(
+                records, [(record_id, None) for record_id in records.ids])
+        else:
+            success_count, error_records = _run_in_batches(records, self._assign_records)
+        if missing_ids:
+            error_records.append(_("Missing records: %s") % ", ".join(map(str, missing_ids)))
 
         # Show result message
         message = _("Successfully assigned %s records.") % success_count
@@ -77,34 +175,39 @@ class BulkOwnershipWizard(models.TransientModel):
     new_owner_id = fields.Many2one('res.users', string='New Owner', required=True)
     reason = fields.Text(string='Reason')
 
+    def _transfer_records(self, records):
+        """Transfer the ownership of the given records to the new owner"""
+        records.transfer_ownership(
+            new_owner_id=self.new_owner_id.id,
+            reason=self.reason
+        )
+
     def action_transfer(self):
         """Bulk transfer ownership of selected records"""
         self.ensure_one()
 
         # Parse record IDs
-        record_ids = eval(self.record_ids) if self.record_ids else []
+        record_ids = _parse_record_ids(self.record_ids) or _parse_record_ids(self.env.context.get('active_ids'))
         if not record_ids:
             raise ValidationError(_("No records selected for ownership transfer."))
 
-        # Get the records
+        # Get the records, dropping the ones deleted meanwhile with a single query
         records = self.env[self.model_name].browse(record_ids)
-
-        # Transfer ownership for each record
-        success_count = 0
-        error_records = []
-
-        for record in records:
-            try:
-                if hasattr(record, 'transfer_ownership'):
-                    record.transfer_ownership(
-                        new_owner_id=self.new_owner_id.id,
-                        reason=self.reason
-                    )
-                    success_count += 1
-                else:
-                    error_records.append(record.display_name)
-            except Exception as e:
-                error_records.append(f"{record.display_name}: {str(e)}")
+        existing = records.exists()
+        missing_ids = sorted(set(records.ids) - set(existing.ids))
+        records = existing
+        if not records:
+            raise ValidationError(_("None of the selected records exist anymore."))
+
+        # All records share the same model, check its support once
+        if not hasattr(records, 'transfer_ownership'):
+            # Name the records like failures without an error message
+            success_count, error_records = 0, _format_failures(
+                records, [(record_id, None) for record_id in records.ids])
+        else:
+            success_count, error_records = _run_in_batches(records, self._transfer_records)
+        if missing_ids:
+            error_records.append(_("Missing records: %s") % ", ".join(map(str, missing_ids)))
 
         # Show result message
         message = _("Successfully transferred ownership for %s records.") % success_count
@@ -123,8 +226,35 @@ class BulkOwnershipWizard(models.TransientModel):
         }
 
 
+class AccessWizardMixin(models.AbstractModel):
+    _name = 'tk.access.wizard.mixin'
+    _description = 'Access Wizard Mixin - Applies the access settings of a wizard'
+
+    def _apply_access(self, records):
+        """Apply the access control of the wizard to the given records"""
+        records.set_access_level(self.access_level, reason=self.reason)
+
+        # Set allowed users and groups if restricted
+        if self.access_level in ['restricted', 'private']:
+            if self.allowed_user_ids:
+                records.bulk_grant_access_to_users(self.allowed_user_ids.ids, reason=self.reason)
+            if self.allowed_group_ids:
+                records.grant_access_to_groups(self.allowed_group_ids.ids, reason=self.reason)
+            if self.custom_access_group_ids:
+                records.grant_access_to_custom_groups(self.custom_access_group_ids.ids, reason=self.reason)
+
+        # Set access duration if specified
+        if self.access_start_date or self.access_end_date:
+            records.set_access_duration(
+                start_date=self.access_start_date,
+                end_date=self.access_end_date,
+                reason=self.reason
+            )
+
+
 class BulkAccessWizard(models.TransientModel):
     _name = 'tk.bulk.access.wizard'
+    _inherit = 'tk.access.wizard.mixin'
     _description = 'Bulk Access Control Wizard'
 
     model_name = fields.Char(string='Model Name', required=True)
@@ -147,47 +277,27 @@ class BulkAccessWizard(models.TransientModel):
         self.ensure_one()
 
         # Parse record IDs
-        record_ids = eval(self.record_ids) if self.record_ids else []
+        record_ids = _parse_record_ids(self.record_ids) or _parse_record_ids(self.env.context.get('active_ids'))
         if not record_ids:
             raise ValidationError(_("No records selected for access control update."))
 
-        # Get the records
+        # Get the records, dropping the ones deleted meanwhile with a single query
         records = self.env[self.model_name].browse(record_ids)
-
-        # Update access control for each record
-        success_count = 0
-        error_records = []
-
-        for record in records:
-            try:
-                if hasattr(record, 'set_access_level'):
-                    record.set_access_level(self.access_level, reason=self.reason)
-
-                    # Set allowed users and groups if restricted
-                    if self.access_level in ['restricted', 'private']:
-                        if self.allowed_user_ids:
-                            record.bulk_grant_access_to_users(self.allowed_user_ids.ids, reason=self.reason)
-                        if self.allowed_group_ids:
-                            for group in self.allowed_group_ids:
-                                record.grant_access_to_group(group.id, reason=self.reason)
-                        if self.custom_access_group_ids:
-                            for access_group in self.custom_access_group_ids:
-                                record.grant_access_to_custom_group(access_group.id, reason=self.reason)
-
-                # Set access duration if specified
-                if hasattr(record, 'set_access_duration'):
-                    if self.access_start_date or self.access_end_date:
-                        record.set_access_duration(
-                            start_date=self.access_start_date,
-                            end_date=self.access_end_date,
-                            reason=self.reason
-                        )
-
-                    success_count += 1
-                else:
-                    error_records.append(record.display_name)
-            except Exception as e:
-                error_records.append(f"{record.display_name}: {str(e)}")
+        existing = records.exists()
+        missing_ids = sorted(set(records.ids) - set(existing.ids))
+        records = existing
+        if not records:
+            raise ValidationError(_("None of the selected records exist anymore."))
+
+        # All records share the same model, check its support once
+        if not hasattr(records, 'set_access_level'):
+            # Name the records like failures without an error message
+            success_count, error_records = 0, _format_failures(
+                records, [(record_id, None) for record_id in records.ids])
+        else:
+            success_count, error_records = _run_in_batches(records, self._apply_access)
+        if missing_ids:
+            error_records.append(_("Missing records: %s") % ", ".join(map(str, missing_ids)))
 
         # Show result message
         message = _("Successfully updated access control for %s records.") % success_count
@@ -222,9 +332,12 @@ class TransferOwnershipWizard(models.TransientModel):
         res = super().default_get(fields_list)
 
         if 'record_id' in res and 'model_name' in res:
-            record = self.env[res['model_name']].browse(res['record_id'])
-            if hasattr(record, 'owner_id') and record.owner_id:
-                res['current_owner_id'] = record.owner_id.id
+            # Check the field on the model, then read it with a single query
+            Model = self.env[res['model_name']]
+            if 'owner_id' in Model._fields:
+                owner = Model.browse(res['record_id']).read(['owner_id'])
+                if owner and owner[0]['owner_id']:
+                    res['current_owner_id'] = owner[0]['owner_id'][0]
 
         return res
 
@@ -232,30 +345,30 @@ class TransferOwnershipWizard(models.TransientModel):
         """Transfer ownership of the record"""
         self.ensure_one()
 
-        # Get the record
-        record = self.env[self.model_name].browse(self.record_id)
+        # Check the model supports the operation before looking up the record
+        Model = self.env[self.model_name]
+        if not hasattr(Model, 'transfer_ownership'):
+            raise ValidationError(_("This record does not support ownership transfer."))
 
+        record = Model.browse(self.record_id)
         if not record.exists():
             raise ValidationError(_("Record not found."))
 
         try:
-            if hasattr(record, 'transfer_ownership'):
-                record.transfer_ownership(
-                    new_owner_id=self.new_owner_id.id,
-                    reason=self.reason
-                )
-
-                return {
-                    'type': 'ir.actions.client',
-                    'tag': 'display_notification',
-                    'params': {
-                        'title': _('Ownership Transferred'),
-                        'message': _('Ownership successfully transferred to %s') % self.new_owner_id.name,
-                        'type': 'success',
-                    }
+            record.transfer_ownership(
+                new_owner_id=self.new_owner_id.id,
+                reason=self.reason
+            )
+
+            return {
+                'type': 'ir.actions.client',
+                'tag': 'display_notification',
+                'params': {
+                    'title': _('Ownership Transferred'),
+                    'message': _('Ownership successfully transferred to %s') % self.new_owner_id.name,
+                    'type': 'success',
                 }
-            else:
-                raise ValidationError(_("This record does not support ownership transfer."))
+            }
         except Exception as e:
             raise ValidationError(_("Error transferring ownership: %s") % str(e))
 
@@ -281,40 +394,41 @@ class DelegateResponsibilityWizard(models.TransientModel):
         """Delegate responsibility for the record"""
         self.ensure_one()
 
-        # Get the record
-        record = self.env[self.model_name].browse(self.record_id)
+        # Check the model supports the operation before looking up the record
+        Model = self.env[self.model_name]
+        if not hasattr(Model, 'delegate_responsibility'):
+            raise ValidationError(_("This record does not support responsibility delegation."))
 
+        record = Model.browse(self.record_id)
         if not record.exists():
             raise ValidationError(_("Record not found."))
 
         try:
-            if hasattr(record, 'delegate_responsibility'):
-                record.delegate_responsibility(
-                    user_ids=self.user_ids.ids,
-                    responsibility_type=self.responsibility_type,
-                    end_date=self.end_date,
-                    description=self.description,
-                    reason=self.reason
-                )
-
-                user_names = ', '.join(self.user_ids.mapped('name'))
-                return {
-                    'type': 'ir.actions.client',
-                    'tag': 'display_notification',
-                    'params': {
-                        'title': _('Responsibility Delegated'),
-                        'message': _('Responsibility successfully delegated to %s') % user_names,
-                        'type': 'success',
-                    }
+            record.delegate_responsibility(
+                user_ids=self.user_ids.ids,
+                responsibility_type=self.responsibility_type,
+                end_date=self.end_date,
+                description=self.description,
+                reason=self.reason
+            )
+
+            user_names = ', '.join(self.user_ids.mapped('name'))
+            return {
+                'type': 'ir.actions.client',
+                'tag': 'display_notification',
+                'params': {
+                    'title': _('Responsibility Delegated'),
+                    'message': _('Responsibility successfully delegated to %s') % user_names,
+                    'type': 'success',
                 }
-            else:
-                raise ValidationError(_("This record does not support responsibility delegation."))
+            }
         except Exception as e:
             raise ValidationError(_("Error delegating responsibility: %s") % str(e))
 
 
 class ManageAccessWizard(models.TransientModel):
     _name = 'tk.manage.access.wizard'
+    _inherit = 'tk.access.wizard.mixin'
     _description = 'Manage Access Wizard'
 
     model_name = fields.Char(string='Model Name', required=True)
@@ -336,46 +450,26 @@ class ManageAccessWizard(models.TransientModel):
         """Update access control for the record"""
         self.ensure_one()
 
-        # Get the record
-        record = self.env[self.model_name].browse(self.record_id)
+        # Check the model supports the operation before looking up the record
+        Model = self.env[self.model_name]
+        if not hasattr(Model, 'set_access_level'):
+            raise ValidationError(_("This record does not support access control management."))
 
+        record = Model.browse(self.record_id)
         if not record.exists():
             raise ValidationError(_("Record not found."))
 
         try:
-            if hasattr(record, 'set_access_level'):
-                record.set_access_level(self.access_level, reason=self.reason)
-
-                # Set allowed users and groups if restricted
-                if self.access_level in ['restricted', 'private']:
-                    if self.allowed_user_ids:
-                        record.bulk_grant_access_to_users(self.allowed_user_ids.ids, reason=self.reason)
-                    if self.allowed_group_ids:
-                        for group in self.allowed_group_ids:
-                            record.grant_access_to_group(group.id, reason=self.reason)
-                    if self.custom_access_group_ids:
-                        for access_group in self.custom_access_group_ids:
-                            record.grant_access_to_custom_group(access_group.id, reason=self.reason)
-
-                # Set access duration if specified
-                if hasattr(record, 'set_access_duration'):
-                    if self.access_start_date or self.access_end_date:
-                        record.set_access_duration(
-                            start_date=self.access_start_date,
-                            end_date=self.access_end_date,
-                            reason=self.reason
-                        )
-
-                return {
-                    'type': 'ir.actions.client',
-                    'tag': 'display_notification',
-                    'params': {
-                        'title': _('Access Updated'),
-                        'message': _('Access control successfully updated'),
-                        'type': 'success',
-                    }
+            self._apply_access(record)
+
+            return {
+                'type': 'ir.actions.client',
+                'tag': 'display_notification',
+                'params': {
+                    'title': _('Access Updated'),
+                    'message': _('Access control successfully updated'),
+                    'type': 'success',
                 }
-            else:
-                raise ValidationError(_("This record does not support access control management."))
+            }
         except Exception as e:
             raise ValidationError(_("Error updating access control: %s") % str(e))